@@ -1,27 +1,43 @@
 from __future__ import annotations
 
-import argparse
+import atexit
 import csv
+import difflib
+import hashlib
 import io
 import json
+import math
 import os
-import platform
+import pickle
+import queue
 import re
 import sys
+import tempfile
 import threading
 import time
 import zipfile
 import datetime
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
 from pathlib import Path
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 from functools import lru_cache
-from html import unescape
-from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
-
-import xml.etree.ElementTree as ET
+from html.parser import HTMLParser
+from typing import Any, Callable, Dict, FrozenSet, Iterable, List, Optional, Set, Tuple
 
 import requests
 from dotenv import load_dotenv
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    from lxml import etree as lxml_etree
+except ImportError:  # lxml is optional; stdlib parsers are used instead.
+    lxml_etree = None
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; stdlib json is used instead.
+    orjson = None
 
 try:
     sys.stdout.reconfigure(encoding="utf-8", errors="replace")
@@ -50,6 +66,95 @@ YAHOO_QUOTE_SUMMARY_URL = "https://query2.finance.yahoo.com/v10/finance/quoteSum
 STOOQ_QUOTE_URL = "https://stooq.pl/q/l/"
 NASDAQ_SCREENER_URL = "https://api.nasdaq.com/api/screener/stocks"
 ASX_LISTED_COMPANIES_URL = "https://www.asx.com.au/asx/research/ASXListedCompanies.csv"
+
+
+def _env_float(name: str, default: float, minimum: float = 0.0) -> float:
+    """Numeric .env setting; a blank or malformed value falls back to the default instead of breaking import."""
+    try:
+        value = float(os.getenv(name, "").strip())
+    except ValueError:
+        value = default
+    if not math.isfinite(value):
+        value = default
+    return max(minimum, value)
+
+
+def _env_int(name: str, default: int, minimum: int = 0) -> int:
+    return max(minimum, int(_env_float(name, default, minimum)))
+
+
+# DART requests in flight at once, shared by every fetch_dart_financials call.
+DART_FETCH_WORKERS = _env_int("DART_FETCH_WORKERS", 8, minimum=1)
+# Tickers fetched concurrently by the official (live) Range Scan.
+SCAN_WORKERS = _env_int("SCAN_WORKERS", 8, minimum=1)
+
+
+def _build_http_session() -> requests.Session:
+    """Keep-alive session with a small retry budget for transient upstream errors.
+
+    One pool per upstream host (about a dozen) and enough connections per host for every
+    concurrent DART worker, so parallel fetches reuse warm connections instead of discarding them.
+    """
+    session = requests.Session()
+    retry = Retry(
+        total=2,
+        backoff_factor=0.3,
+        # Gateway errors only: KIS reports an expired token as HTTP 500 (KisClient re-issues it), and
+        # callers such as fetch_yahoo_quotes_batch run their own 429 backoff.
+        status_forcelist=(502, 503, 504),
+        # Otherwise urllib3 still retries any 429 that carries Retry-After.
+        respect_retry_after_header=False,
+        allowed_methods=frozenset({"GET"}),
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(pool_connections=16, pool_maxsize=max(32, DART_FETCH_WORKERS), max_retries=retry)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+# Shared pool for every upstream (KRX/DART/KIS/SEC/Yahoo/Stooq/Nasdaq/ASX) so repeated
+# lookups skip the TCP/TLS handshake. J-Quants keeps its own paced session.
+_HTTP_SESSION = _build_http_session()
+
+
+class _RateLimiter:
+    """Thread-safe pacing: request starts are spaced at least 1/per_second apart across threads."""
+
+    def __init__(self, per_second: float):
+        self.interval = 1.0 / per_second if per_second > 0 else 0.0
+        self._next_at = 0.0
+        self._lock = threading.Lock()
+
+    def wait(self) -> None:
+        if not self.interval:
+            return
+        with self._lock:
+            start_at = max(time.monotonic(), self._next_at)
+            self._next_at = start_at + self.interval
+        delay = start_at - time.monotonic()
+        if delay > 0:
+            time.sleep(delay)
+
+
+# Client-side pacing so concurrent lookups queue briefly instead of tripping the APIs' rate limits.
+DART_REQUESTS_PER_SECOND = _env_float("DART_REQUESTS_PER_SECOND", 10)
+KIS_REQUESTS_PER_SECOND = _env_float("KIS_REQUESTS_PER_SECOND", 15)
+_DART_RATE_LIMITER = _RateLimiter(DART_REQUESTS_PER_SECOND)
+_KIS_RATE_LIMITER = _RateLimiter(KIS_REQUESTS_PER_SECOND)
+
+_NON_DIGITS_RE = re.compile(r"\D+")
+_DIGIT_OR_DOT_RE = re.compile(r"[\d.]")
+_WHITESPACE_RE = re.compile(r"\s+")
+_LIST_SEPARATORS_RE = re.compile(r"[\s,;]+")
+_UNIT_SEPARATORS_RE = re.compile(r"[,/ ]+")
+_LEADING_YEAR_RE = re.compile(r"\s*(\d{4})")
+_NON_TICKER_CHARS_RE = re.compile(r"[^A-Za-z0-9\.-]")
+_NON_JP_CODE_CHARS_RE = re.compile(r"[^0-9A-Z]")
+_JP_CODE_RE = re.compile(r"[0-9A-Z]{4,5}")
+_FIVE_DIGITS_RE = re.compile(r"\d{5}")
+_DART_STATUS_TAG_RE = re.compile(r"<status>\s*([^<]+)\s*</status>")
+_DART_MESSAGE_TAG_RE = re.compile(r"<message>\s*([^<]+)\s*</message>")
 SEC_FORM_PRIORITY = ("10-K", "20-F", "40-F", "10-Q", "10-Q/A", "8-K", "6-K")
 EDGAR_REVENUE_KEYS = (
     "Revenues",
@@ -72,6 +177,20 @@ KR_FUNDAMENTALS_CACHE_PATH = Path("data") / "kr_fundamentals_cache.jsonl"
 JP_FUNDAMENTALS_CACHE_PATH = Path("data") / "jp_fundamentals_cache.jsonl"
 UK_FUNDAMENTALS_CACHE_PATH = Path("data") / "uk_fundamentals_cache.jsonl"
 FUNDAMENTALS_CACHE_MAX_AGE_SECONDS = 24 * 60 * 60
+LOOKUP_CACHE_MAX_AGE_SECONDS = 24 * 60 * 60
+# Bump the version suffix whenever normalize_name changes, since cached map keys depend on it.
+KRX_NAME_MAP_CACHE_FILE = "krx_name_map.v2.pkl"
+DART_CORP_MAP_CACHE_FILE = "dart_corp_map.v2.pkl"
+EDGAR_TICKER_MAP_CACHE_FILE = "edgar_ticker_map.v1.pkl"
+# Filed DART reports rarely change (corrections aside); successful per-report lists are cached
+# on disk for this long. 0 disables the cache.
+DART_REPORT_CACHE_MAX_AGE_SECONDS = _env_int("DART_REPORT_CACHE_DAYS", 7) * 24 * 60 * 60
+# Name inputs that exactly matched a KRX code / DART corp, so a restart can skip loading the maps.
+# v2 drops v1 files, which could hold partial and typo matches.
+RESOLVED_NAMES_CACHE_FILE = "resolved_names.v2.pkl"
+RESOLVED_NAMES_MAX_AGE_SECONDS = 7 * 24 * 60 * 60
+# New resolutions are written in one batch this long after the first unsaved one (and at exit).
+RESOLVED_NAMES_FLUSH_DELAY_SECONDS = 5.0
 
 # (reprt_code, release_month, release_year_offset_from_bsns_year)
 REPORT_SCHEDULE = (
@@ -80,6 +199,10 @@ REPORT_SCHEDULE = (
     ("11013", 5, 0),   # 1분기보고서
     ("11011", 3, 1),   # 사업보고서 (다음 해 3월 공시)
 )
+# (reprt_code, release-month offset): a report for `year` is released at ordinal year * 12 + offset.
+_REPORT_SCHEDULE_ORDINALS = tuple(
+    (code, year_offset * 12 + release_month) for code, release_month, year_offset in REPORT_SCHEDULE
+)
 
 
 class KisError(Exception):
@@ -98,6 +221,21 @@ class OfficialDataError(Exception):
     """Raised when an official non-US/non-KR data source cannot satisfy a lookup."""
 
 
+def _json_loads(data: Any) -> Any:
+    """Parse JSON text/bytes with orjson when installed; stdlib handles what orjson rejects (e.g. NaN)."""
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(data)
+
+
+def _json(resp: requests.Response) -> Any:
+    """Decode a JSON response body straight from bytes (see _json_loads for the NaN fallback)."""
+    return _json_loads(resp.content)
+
+
 def is_dart_usage_limit_error(error: Any) -> bool:
     text = str(error or "")
     return "020" in text and "사용한도" in text
@@ -108,15 +246,15 @@ def describe_dart_error_payload(content: bytes) -> str:
     if not text:
         return "empty response"
     try:
-        payload = json.loads(text)
+        payload = _json_loads(content)
         status = payload.get("status")
         message = payload.get("message", "")
         if status or message:
             return f"{status} {message}".strip()
     except Exception:
         pass
-    status_match = re.search(r"<status>\s*([^<]+)\s*</status>", text)
-    message_match = re.search(r"<message>\s*([^<]+)\s*</message>", text)
+    status_match = _DART_STATUS_TAG_RE.search(text)
+    message_match = _DART_MESSAGE_TAG_RE.search(text)
     if status_match or message_match:
         return " ".join(
             part
@@ -129,50 +267,387 @@ def describe_dart_error_payload(content: bytes) -> str:
     return text[:300]
 
 
+# Every code point str.split() treats as whitespace (all of them sit at or below U+3000).
+_WHITESPACE_DELETE = {cp: None for cp in range(0x3001) if chr(cp).isspace()}
+
+
+@lru_cache(maxsize=65536)
 def normalize_name(text: str) -> str:
-    return "".join((text or "").lower().split())
+    text = text or ""
+    # Quick check: printable ASCII without spaces only needs lower() (same as casefold there).
+    if text.isascii() and text.isprintable() and " " not in text:
+        return text.lower()
+    return text.casefold().translate(_WHITESPACE_DELETE)
 
 
 @lru_cache(maxsize=1)
+def _today_for_minute(minute: int) -> datetime.date:
+    return datetime.date.today()
+
+
+def _today() -> datetime.date:
+    """Local date, re-read at most once a minute (the fetch paths ask for it per call)."""
+    return _today_for_minute(int(time.time()) // 60)
+
+
+def lookup_cache_dir() -> Path:
+    configured = os.getenv("LOOKUP_CACHE_DIR")
+    if configured:
+        return Path(configured)
+    return Path.home() / ".cache" / "mr-leon"
+
+
+def _read_lookup_cache(filename: str, max_age_seconds: Optional[int] = LOOKUP_CACHE_MAX_AGE_SECONDS) -> Any:
+    """Return the pickled lookup map if it is fresh (or any age when max_age_seconds is None), else None."""
+    path = lookup_cache_dir() / filename
+    try:
+        if max_age_seconds is not None and time.time() - path.stat().st_mtime > max_age_seconds:
+            return None
+        with path.open("rb") as handle:
+            return pickle.load(handle)
+    except Exception:
+        return None
+
+
+def _write_lookup_cache(filename: str, value: Any, resp: Optional[requests.Response] = None) -> None:
+    """Best-effort atomic write of a lookup map; failures only cost a re-download next run.
+
+    The response's ETag/Last-Modified validators are kept in a JSON sidecar for conditional GETs.
+    """
+    path = lookup_cache_dir() / filename
+    meta_path = path.with_suffix(".meta.json")
+    tmp_path: Optional[Path] = None
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # A unique temp file per writer, so concurrent writes never interleave before the rename.
+        with tempfile.NamedTemporaryFile(
+            "wb", dir=path.parent, prefix=f"{path.name}.", suffix=".tmp", delete=False
+        ) as handle:
+            tmp_path = Path(handle.name)
+            pickle.dump(value, handle, protocol=pickle.HIGHEST_PROTOCOL)
+        tmp_path.replace(path)
+        tmp_path = None
+        if resp is None:
+            meta_path.unlink(missing_ok=True)
+            return
+        validators = {
+            "etag": resp.headers.get("ETag"),
+            "last_modified": resp.headers.get("Last-Modified"),
+        }
+        meta_path.write_text(json.dumps(validators), encoding="utf-8")
+    except Exception:
+        if tmp_path is not None:
+            tmp_path.unlink(missing_ok=True)
+
+
+def _stale_lookup_cache(filename: str) -> Tuple[Any, Dict[str, str]]:
+    """Return (expired cached map, conditional-GET headers), or (None, {}) without usable validators."""
+    path = lookup_cache_dir() / filename
+    try:
+        validators = json.loads(path.with_suffix(".meta.json").read_text(encoding="utf-8"))
+    except Exception:
+        return None, {}
+    headers = {}
+    if validators.get("etag"):
+        headers["If-None-Match"] = validators["etag"]
+    if validators.get("last_modified"):
+        headers["If-Modified-Since"] = validators["last_modified"]
+    if not headers:
+        return None, {}
+    cached = _read_lookup_cache(filename, max_age_seconds=None)
+    return (cached, headers) if cached else (None, {})
+
+
+def _dart_report_cache_file(kind: str, corp_code: str, bsns_year: str, reprt_code: str) -> str:
+    return f"dart_reports/{kind}_{corp_code}_{bsns_year}_{reprt_code}.pkl"
+
+
+def _read_dart_report_cache(filename: str) -> Optional[List[Dict]]:
+    if not DART_REPORT_CACHE_MAX_AGE_SECONDS:
+        return None
+    return _read_lookup_cache(filename, max_age_seconds=DART_REPORT_CACHE_MAX_AGE_SECONDS)
+
+
+def _touch_lookup_cache(filename: str) -> None:
+    """Mark a revalidated (HTTP 304) cache entry fresh again."""
+    try:
+        (lookup_cache_dir() / filename).touch()
+    except OSError:
+        pass
+
+
+def _iter_krx_listing_rows(content: bytes) -> Iterable[Tuple[str, str]]:
+    """Yield (name, code) cell text from the EUC-KR KRX listing table rows."""
+    # Data rows contain name/code at positions 0/2; the header row uses <th> and is skipped.
+    if lxml_etree is not None:
+        # Stream rows straight from the EUC-KR bytes and drop each one once read.
+        for _, tr in lxml_etree.iterparse(
+            io.BytesIO(content), events=("end",), tag="tr", html=True, encoding="euc-kr"
+        ):
+            tds = tr.findall("td")
+            if len(tds) >= 3:
+                yield "".join(tds[0].itertext()).strip(), "".join(tds[2].itertext()).strip()
+            tr.clear()
+            while tr.getprevious() is not None:
+                del tr.getparent()[0]
+        return
+
+    # Without lxml, one stdlib HTMLParser pass collects the cells (entities are unescaped by the parser).
+    parser = _KrxRowParser()
+    parser.feed(content.decode("euc-kr", errors="ignore"))
+    parser.close()
+    yield from parser.rows
+
+
+class _KrxRowParser(HTMLParser):
+    """Collect (first, third) <td> text of each KRX listing row in one linear pass."""
+
+    def __init__(self) -> None:
+        super().__init__(convert_charrefs=True)
+        self.rows: List[Tuple[str, str]] = []
+        self._cells: Optional[List[str]] = None
+        self._text: Optional[List[str]] = None
+
+    def handle_starttag(self, tag: str, attrs) -> None:
+        if tag == "tr":
+            self._cells = []
+        elif tag == "td" and self._cells is not None:
+            self._text = []
+
+    def handle_endtag(self, tag: str) -> None:
+        if tag == "td" and self._text is not None:
+            self._cells.append("".join(self._text).strip())
+            self._text = None
+        elif tag == "tr" and self._cells is not None:
+            if len(self._cells) >= 3:
+                self.rows.append((self._cells[0], self._cells[2]))
+            self._cells = None
+
+    def handle_data(self, data: str) -> None:
+        if self._text is not None:
+            self._text.append(data)
+
+
+_NAME_MAP: Optional[Dict[str, str]] = None
+_DART_CORP_MAPS: Optional[Tuple[Dict[str, str], Dict[str, str], Dict[str, str]]] = None
+_LOOKUP_MAPS_LOCK = threading.RLock()
+
+
+def clear_lookup_maps() -> None:
+    """Drop the in-process KRX/DART/SEC name maps (the disk cache is left alone)."""
+    global _NAME_MAP, _DART_CORP_MAPS, _RESOLVED_NAMES, _RESOLVED_NAMES_FLUSH
+    _NAME_MAP = None
+    _DART_CORP_MAPS = None
+    with _RESOLVED_NAMES_LOCK:
+        # Unsaved resolutions are dropped with the in-process copy.
+        if _RESOLVED_NAMES_FLUSH is not None:
+            _RESOLVED_NAMES_FLUSH.cancel()
+            _RESOLVED_NAMES_FLUSH = None
+        _RESOLVED_NAMES = None
+    load_edgar_ticker_map.cache_clear()
+
+
+_RESOLVED_NAMES: Optional[Dict[str, Tuple[float, Any]]] = None
+_RESOLVED_NAMES_LOCK = threading.Lock()
+_RESOLVED_NAMES_FLUSH: Optional[threading.Timer] = None
+
+
+def _resolved_names() -> Dict[str, Tuple[float, Any]]:
+    global _RESOLVED_NAMES
+    if _RESOLVED_NAMES is None:
+        _RESOLVED_NAMES = _read_lookup_cache(RESOLVED_NAMES_CACHE_FILE, max_age_seconds=None) or {}
+    return _RESOLVED_NAMES
+
+
+def _recall_resolution(key: str) -> Any:
+    """Return a previously resolved value for key if it is younger than RESOLVED_NAMES_MAX_AGE_SECONDS."""
+    with _RESOLVED_NAMES_LOCK:
+        entry = _resolved_names().get(key)
+    if entry is None or time.time() - entry[0] > RESOLVED_NAMES_MAX_AGE_SECONDS:
+        return None
+    return entry[1]
+
+
+def _remember_resolution(key: str, value: Any) -> None:
+    """Record an exact name-map hit; the disk copy is rewritten in batches by _flush_resolved_names."""
+    global _RESOLVED_NAMES_FLUSH
+    with _RESOLVED_NAMES_LOCK:
+        names = _resolved_names()
+        entry = names.get(key)
+        if entry is not None and entry[1] == value and time.time() - entry[0] <= RESOLVED_NAMES_MAX_AGE_SECONDS:
+            return
+        names[key] = (time.time(), value)
+        if _RESOLVED_NAMES_FLUSH is None:
+            _RESOLVED_NAMES_FLUSH = threading.Timer(RESOLVED_NAMES_FLUSH_DELAY_SECONDS, _flush_resolved_names)
+            _RESOLVED_NAMES_FLUSH.daemon = True
+            _RESOLVED_NAMES_FLUSH.start()
+
+
+def _flush_resolved_names() -> None:
+    """Write pending resolutions to disk, if any; the lock keeps scan workers from racing the write."""
+    global _RESOLVED_NAMES_FLUSH
+    with _RESOLVED_NAMES_LOCK:
+        pending, _RESOLVED_NAMES_FLUSH = _RESOLVED_NAMES_FLUSH, None
+        if pending is None or _RESOLVED_NAMES is None:
+            return
+        pending.cancel()
+        _write_lookup_cache(RESOLVED_NAMES_CACHE_FILE, _RESOLVED_NAMES)
+
+
+atexit.register(_flush_resolved_names)
+
+
 def load_name_map() -> Dict[str, str]:
+    """Return the KRX company-name -> 6-digit code map, loading it once per process."""
+    global _NAME_MAP
+    mapping = _NAME_MAP
+    if mapping is None:
+        # Parallel scan workers hit this together on a cold start; build the map only once.
+        with _LOOKUP_MAPS_LOCK:
+            mapping = _NAME_MAP
+            if mapping is None:
+                mapping = _NAME_MAP = _build_name_map()
+    return mapping
+
+
+def _build_name_map() -> Dict[str, str]:
     """Download KRX listing HTML and build a company-name -> 6-digit code map."""
-    resp = requests.get(KRX_LISTING_URL, timeout=10)
+    cached = _read_lookup_cache(KRX_NAME_MAP_CACHE_FILE)
+    if cached:
+        return cached
+
+    stale, conditional_headers = _stale_lookup_cache(KRX_NAME_MAP_CACHE_FILE)
+    resp = _HTTP_SESSION.get(KRX_LISTING_URL, headers=conditional_headers, timeout=10)
+    if resp.status_code == 304 and stale:
+        _touch_lookup_cache(KRX_NAME_MAP_CACHE_FILE)
+        return stale
     if resp.status_code != 200:
         raise KisError(f"Failed to load KRX listing: HTTP {resp.status_code}")
 
-    html = resp.content.decode("euc-kr", errors="ignore")
     mapping: Dict[str, str] = {}
 
-    # Parse table rows; first row is header, data rows contain name/code at positions 0/2.
-    for tr in re.findall(r"<tr>(.*?)</tr>", html, flags=re.S):
-        cells = re.findall(r"<td[^>]*>(.*?)</td>", tr, flags=re.S)
-        if len(cells) < 3:
-            continue
-        raw_name = unescape(re.sub(r"<.*?>", "", cells[0])).strip()
-        raw_code = unescape(re.sub(r"<.*?>", "", cells[2])).strip()
+    for raw_name, raw_code in _iter_krx_listing_rows(resp.content):
         if not raw_name or not raw_code or not raw_code.isdigit():
             continue
         mapping[normalize_name(raw_name)] = raw_code.zfill(6)
 
     if not mapping:
         raise KisError("KRX listing loaded but empty.")
+    _write_lookup_cache(KRX_NAME_MAP_CACHE_FILE, mapping, resp)
     return mapping
 
 
+_KRX_CODES: Optional[Tuple[Dict[str, str], FrozenSet[str]]] = None
+
+
+def krx_listed_codes() -> FrozenSet[str]:
+    """Return the set of KRX-listed 6-digit codes, rebuilt only when the name map is reloaded."""
+    global _KRX_CODES
+    mapping = load_name_map()
+    cached = _KRX_CODES
+    if cached is None or cached[0] is not mapping:
+        cached = _KRX_CODES = (mapping, frozenset(mapping.values()))
+    return cached[1]
+
+
+class _SubstringIndex:
+    """Trigram index answering the "norm in key or key in norm" partial-match fallback.
+
+    Returns the same key a linear scan over the mapping would (the first in insertion order).
+    """
+
+    def __init__(self, keys: Iterable[str]):
+        self.keys: List[str] = list(keys)
+        self.positions: Dict[str, int] = {key: pos for pos, key in enumerate(self.keys)}
+        self.max_len = max(map(len, self.keys), default=0)
+        self.grams: Dict[str, List[int]] = {}
+        for pos, key in enumerate(self.keys):
+            for gram in {key[i : i + 3] for i in range(len(key) - 2)}:
+                self.grams.setdefault(gram, []).append(pos)
+
+    def first_match(self, norm: str) -> Optional[str]:
+        if not norm:
+            return self.keys[0] if self.keys else None
+        best: Optional[int] = None
+        # Keys contained in the query: probe every substring no longer than the longest key.
+        for start in range(len(norm)):
+            for end in range(start + 1, min(len(norm), start + self.max_len) + 1):
+                pos = self.positions.get(norm[start:end])
+                if pos is not None and (best is None or pos < best):
+                    best = pos
+        # Query contained in a key: intersect the trigram postings, then verify.
+        if len(norm) >= 3:
+            postings = [self.grams.get(norm[i : i + 3], ()) for i in range(len(norm) - 2)]
+            shortest = min(postings, key=len)
+            for pos in shortest:
+                if best is not None and pos >= best:
+                    break
+                if norm in self.keys[pos]:
+                    best = pos
+                    break
+        else:
+            for pos, key in enumerate(self.keys if best is None else self.keys[:best]):
+                if norm in key:
+                    best = pos
+                    break
+        return self.keys[best] if best is not None else None
+
+    def close_match(self, norm: str, cutoff: float = 0.8, shortlist: int = 50) -> Optional[str]:
+        """Typo suggestion: rank keys sharing trigrams with the query, then score with difflib.
+
+        Only for "did you mean" messages; a close match is never resolved silently.
+        """
+        if len(norm) < 3:
+            return None
+        shared: Dict[int, int] = {}
+        for gram in {norm[i : i + 3] for i in range(len(norm) - 2)}:
+            for pos in self.grams.get(gram, ()):
+                shared[pos] = shared.get(pos, 0) + 1
+        if not shared:
+            return None
+        ranked = sorted(shared, key=lambda pos: (-shared[pos], pos))[:shortlist]
+        matches = difflib.get_close_matches(norm, [self.keys[pos] for pos in ranked], n=1, cutoff=cutoff)
+        return matches[0] if matches else None
+
+
+_SUBSTRING_INDEXES: Dict[int, Tuple[Dict[str, str], _SubstringIndex]] = {}
+
+
+def _substring_index_for(mapping: Dict[str, str]) -> _SubstringIndex:
+    """Build (once per loaded map) the partial-match index for a name map."""
+    cached = _SUBSTRING_INDEXES.get(id(mapping))
+    if cached is not None and cached[0] is mapping:
+        return cached[1]
+    index = _SubstringIndex(mapping)
+    if len(_SUBSTRING_INDEXES) >= 4:
+        _SUBSTRING_INDEXES.clear()
+    _SUBSTRING_INDEXES[id(mapping)] = (mapping, index)
+    return index
+
+
 def lookup_code_by_name(name: str) -> Optional[str]:
     """Resolve a company name to its 6-digit code via KRX listing."""
     if not name:
         return None
-    mapping = load_name_map()
     norm = normalize_name(name)
-    direct = mapping.get(norm)
-    if direct:
-        return direct
-    # Fallback: partial match for spacing differences.
-    for key, code in mapping.items():
-        if norm in key or key in norm:
-            return code
-    return None
+    remembered = _recall_resolution(f"krx:{norm}")
+    if remembered:
+        return remembered
+    mapping = load_name_map()
+    code = mapping.get(norm)
+    if code:
+        # Only exact hits are remembered; fallbacks are re-derived from the current map.
+        _remember_resolution(f"krx:{norm}", code)
+        return code
+    # Fallback: partial match for spacing differences; a typo only earns a suggestion.
+    index = _substring_index_for(mapping)
+    key = index.first_match(norm)
+    if key is None:
+        suggestion = index.close_match(norm)
+        if suggestion is not None:
+            raise KisError(f"No KRX listing matches '{name.strip()}'. Did you mean '{suggestion}'?")
+        return None
+    return mapping[key]
 
 
 def get_dart_key() -> str:
@@ -182,8 +657,50 @@ def get_dart_key() -> str:
     return key
 
 
-@lru_cache(maxsize=1)
+def _iter_dart_corp_items(source: Any) -> Iterable[Tuple[str, str, str]]:
+    """Stream (corp_name, corp_code, stock_code) from corpCode.xml, clearing each <list> once read."""
+    if lxml_etree is not None:
+        for _, item in lxml_etree.iterparse(source, events=("end",), tag="list"):
+            yield (
+                (item.findtext("corp_name") or "").strip(),
+                (item.findtext("corp_code") or "").strip(),
+                (item.findtext("stock_code") or "").strip(),
+            )
+            item.clear()
+            while item.getprevious() is not None:
+                del item.getparent()[0]
+        return
+
+    import xml.etree.ElementTree as ET  # deferred: pulls in pyexpat, only needed without lxml
+
+    root = None
+    for event, item in ET.iterparse(source, events=("start", "end")):
+        if root is None:
+            root = item
+        if event != "end" or item.tag != "list":
+            continue
+        yield (
+            (item.findtext("corp_name") or "").strip(),
+            (item.findtext("corp_code") or "").strip(),
+            (item.findtext("stock_code") or "").strip(),
+        )
+        # ElementTree has no getprevious(); clearing the root drops the finished <list> shells too.
+        root.clear()
+
+
 def load_dart_corp_map() -> Tuple[Dict[str, str], Dict[str, str], Dict[str, str]]:
+    """Return the OpenDART corp-code lookup maps, loading them once per process."""
+    global _DART_CORP_MAPS
+    maps = _DART_CORP_MAPS
+    if maps is None:
+        with _LOOKUP_MAPS_LOCK:
+            maps = _DART_CORP_MAPS
+            if maps is None:
+                maps = _DART_CORP_MAPS = _build_dart_corp_map()
+    return maps
+
+
+def _build_dart_corp_map() -> Tuple[Dict[str, str], Dict[str, str], Dict[str, str]]:
     """Download OpenDART corp codes and build lookup maps.
 
     Returns:
@@ -191,43 +708,59 @@ def load_dart_corp_map() -> Tuple[Dict[str, str], Dict[str, str], Dict[str, str]
         stock_to_code: 6-digit stock code -> corp_code
         code_to_name: corp_code -> original corp_name
     """
-    resp = requests.get(DART_CORP_CODE_URL, params={"crtfc_key": get_dart_key()}, timeout=15)
-    if resp.status_code != 200:
-        raise DartError(f"Failed to load DART corp codes: HTTP {resp.status_code}")
-
-    try:
-        with zipfile.ZipFile(io.BytesIO(resp.content)) as zf:
-            names = zf.namelist()
-            if not names:
-                raise DartError("DART corp code zip is empty.")
-            xml_bytes = zf.read(names[0])
-    except zipfile.BadZipFile as exc:
-        detail = describe_dart_error_payload(resp.content)
-        raise DartError(f"Failed to load DART corp codes: {detail}") from exc
-
-    try:
-        root = ET.fromstring(xml_bytes)
-    except ET.ParseError as exc:
-        raise DartError(f"Failed to parse corp code XML: {exc}") from exc
+    cached = _read_lookup_cache(DART_CORP_MAP_CACHE_FILE)
+    if cached:
+        return cached
+    stale, conditional_headers = _stale_lookup_cache(DART_CORP_MAP_CACHE_FILE)
 
     name_to_code: Dict[str, str] = {}
     stock_to_code: Dict[str, str] = {}
     code_to_name: Dict[str, str] = {}
 
-    for item in root.findall("list"):
-        corp_name = (item.findtext("corp_name") or "").strip()
-        corp_code = (item.findtext("corp_code") or "").strip()
-        stock_code = (item.findtext("stock_code") or "").strip()
-        norm_name = normalize_name(corp_name)
+    # Spool the zip (in memory up to a limit, then on disk) and stream the XML member
+    # straight into iterparse so the decompressed document is never held in full.
+    with tempfile.SpooledTemporaryFile(max_size=32 * 1024 * 1024) as spool:
+        with _HTTP_SESSION.get(
+            DART_CORP_CODE_URL,
+            params={"crtfc_key": get_dart_key()},
+            headers=conditional_headers,
+            timeout=15,
+            stream=True,
+        ) as resp:
+            if resp.status_code == 304 and stale:
+                _touch_lookup_cache(DART_CORP_MAP_CACHE_FILE)
+                return stale
+            if resp.status_code != 200:
+                raise DartError(f"Failed to load DART corp codes: HTTP {resp.status_code}")
+            for chunk in resp.iter_content(chunk_size=256 * 1024):
+                spool.write(chunk)
+        spool.seek(0)
 
-        if corp_code and norm_name:
-            name_to_code.setdefault(norm_name, corp_code)
-            code_to_name.setdefault(corp_code, corp_name)
-        if stock_code:
-            stock_to_code.setdefault(stock_code.zfill(6), corp_code)
+        try:
+            with zipfile.ZipFile(spool) as zf:
+                names = zf.namelist()
+                if not names:
+                    raise DartError("DART corp code zip is empty.")
+                with zf.open(names[0]) as xml_stream:
+                    for corp_name, corp_code, stock_code in _iter_dart_corp_items(xml_stream):
+                        norm_name = normalize_name(corp_name)
+
+                        if corp_code and norm_name:
+                            name_to_code.setdefault(norm_name, corp_code)
+                            code_to_name.setdefault(corp_code, corp_name)
+                        if stock_code:
+                            stock_to_code.setdefault(stock_code.zfill(6), corp_code)
+        except zipfile.BadZipFile as exc:
+            # DART error bodies are tiny; don't pull a large non-zip body back into memory.
+            spool.seek(0)
+            detail = describe_dart_error_payload(spool.read(64 * 1024))
+            raise DartError(f"Failed to load DART corp codes: {detail}") from exc
+        except SyntaxError as exc:  # ET.ParseError and lxml's XMLSyntaxError both subclass SyntaxError.
+            raise DartError(f"Failed to parse corp code XML: {exc}") from exc
 
     if not name_to_code:
         raise DartError("DART corp code mapping is empty.")
+    _write_lookup_cache(DART_CORP_MAP_CACHE_FILE, (name_to_code, stock_to_code, code_to_name), resp)
     return name_to_code, stock_to_code, code_to_name
 
 
@@ -236,9 +769,14 @@ def resolve_dart_corp(user_text: str) -> Tuple[str, str]:
     if not user_text:
         raise DartError("회사명을 입력하세요.")
 
-    name_map, stock_map, code_to_name = load_dart_corp_map()
     trimmed = user_text.strip()
-    digits = "".join(ch for ch in trimmed if ch.isdigit())
+    norm = normalize_name(trimmed)
+    remembered = _recall_resolution(f"dart:{norm}")
+    if remembered:
+        return remembered
+
+    name_map, stock_map, code_to_name = load_dart_corp_map()
+    digits = _NON_DIGITS_RE.sub("", trimmed)
 
     if len(digits) >= 8:
         corp_code = digits[:8]
@@ -249,20 +787,27 @@ def resolve_dart_corp(user_text: str) -> Tuple[str, str]:
         if corp_code:
             return corp_code, code_to_name.get(corp_code, trimmed)
 
-    norm = normalize_name(trimmed)
-    direct = name_map.get(norm)
-    if direct:
-        return direct, code_to_name.get(direct, trimmed)
+    corp_code = name_map.get(norm)
+    if corp_code:
+        resolved = (corp_code, code_to_name.get(corp_code, trimmed))
+        _remember_resolution(f"dart:{norm}", resolved)
+        return resolved
 
-    for key, corp_code in name_map.items():
-        if norm in key or key in norm:
-            return corp_code, code_to_name.get(corp_code, trimmed)
+    index = _substring_index_for(name_map)
+    key = index.first_match(norm)
+    if key is not None:
+        corp_code = name_map[key]
+        return corp_code, code_to_name.get(corp_code, trimmed)
+    suggestion = index.close_match(norm)
+    if suggestion is not None:
+        suggested_name = code_to_name.get(name_map[suggestion], suggestion)
+        raise DartError(f"회사명을 찾을 수 없습니다. 혹시 '{suggested_name}'을(를) 찾으셨나요?")
 
     raise DartError("회사명을 찾을 수 없습니다. 정식명 또는 상장사 명칭을 입력하세요.")
 
 
 def _pad_cik(value: str) -> str:
-    digits = "".join(ch for ch in str(value) if ch.isdigit())
+    digits = _NON_DIGITS_RE.sub("", str(value))
     return digits.zfill(10) if digits else ""
 
 
@@ -429,8 +974,7 @@ def build_submissions_index(
             if status_cb and processed % 500 == 0:
                 status_cb(f"Indexing submissions... {processed}")
             try:
-                with path.open("r", encoding="utf-8") as in_handle:
-                    payload = json.load(in_handle)
+                payload = _json_loads(path.read_bytes())
             except Exception:
                 continue
 
@@ -467,7 +1011,7 @@ def load_submissions_index() -> Dict[str, Any]:
             if not line:
                 continue
             try:
-                meta = json.loads(line)
+                meta = _json_loads(line)
             except Exception:
                 continue
             cik = _pad_cik(meta.get("cik") or "")
@@ -510,8 +1054,16 @@ def ensure_submissions_index(status_cb: Optional[Callable[[str], None]] = None)
 
 @lru_cache(maxsize=1)
 def load_edgar_ticker_map() -> Tuple[Dict[str, Dict[str, str]], Dict[str, str]]:
-    """Load SEC ticker -> CIK mapping and a normalized name index."""
-    resp = requests.get(SEC_TICKERS_URL, headers=sec_headers(), timeout=15)
+    """Load SEC ticker -> CIK mapping and a normalized name index (cached on disk like the KRX/DART maps)."""
+    cached = _read_lookup_cache(EDGAR_TICKER_MAP_CACHE_FILE)
+    if cached:
+        return cached
+
+    stale, conditional_headers = _stale_lookup_cache(EDGAR_TICKER_MAP_CACHE_FILE)
+    resp = _HTTP_SESSION.get(SEC_TICKERS_URL, headers={**sec_headers(), **conditional_headers}, timeout=15)
+    if resp.status_code == 304 and stale:
+        _touch_lookup_cache(EDGAR_TICKER_MAP_CACHE_FILE)
+        return stale
     if resp.status_code != 200:
         if resp.status_code == 403:
             raise EdgarError(
@@ -519,14 +1071,16 @@ def load_edgar_ticker_map() -> Tuple[Dict[str, Dict[str, str]], Dict[str, str]]:
             )
         raise EdgarError(f"Failed to load SEC ticker list: HTTP {resp.status_code}")
     try:
-        data = resp.json()
+        data = _json(resp)
     except Exception as exc:
         raise EdgarError(f"Invalid SEC ticker list response: {exc}") from exc
 
     ticker_map: Dict[str, Dict[str, str]] = {}
     name_index: Dict[str, str] = {}
-    items = data.values() if isinstance(data, dict) else []
-    for item in items:
+    if not isinstance(data, dict):
+        raise EdgarError("SEC ticker list is empty.")
+    # Fill both maps in one walk over the decoded rows; values() is a view, not a copy.
+    for item in data.values():
         ticker = str(item.get("ticker") or "").upper().strip()
         cik = _pad_cik(item.get("cik_str") or item.get("cik") or "")
         title = (item.get("title") or "").strip()
@@ -538,6 +1092,7 @@ def load_edgar_ticker_map() -> Tuple[Dict[str, Dict[str, str]], Dict[str, str]]:
 
     if not ticker_map:
         raise EdgarError("SEC ticker list is empty.")
+    _write_lookup_cache(EDGAR_TICKER_MAP_CACHE_FILE, (ticker_map, name_index), resp)
     return ticker_map, name_index
 
 
@@ -547,8 +1102,8 @@ def resolve_edgar_company(user_text: str) -> Dict[str, str]:
         raise EdgarError("Enter a ticker, CIK, or company name.")
 
     text = user_text.strip()
-    cleaned_ticker = re.sub(r"[^A-Za-z0-9\.-]", "", text).upper()
-    digits = "".join(ch for ch in text if ch.isdigit())
+    cleaned_ticker = _NON_TICKER_CHARS_RE.sub("", text).upper()
+    digits = _NON_DIGITS_RE.sub("", text)
 
     local = None
     try:
@@ -645,7 +1200,12 @@ ACCOUNT_SYNONYMS = {
     "장기차입금": {"장기차입금", "longtermborrowings"},
 }
 
-ACCOUNT_ALIAS_MAP = {normalize_name(alias): key for key, aliases in ACCOUNT_SYNONYMS.items() for alias in aliases}
+# Keys and labels are interned so hits against ACCOUNT_SYNONYMS labels compare by identity.
+ACCOUNT_ALIAS_MAP = {
+    sys.intern(normalize_name(alias)): sys.intern(key)
+    for key, aliases in ACCOUNT_SYNONYMS.items()
+    for alias in aliases
+}
 ACCOUNT_KEYS = tuple(ACCOUNT_SYNONYMS.keys())
 ACCOUNT_REVENUE_KEY = ACCOUNT_KEYS[0]
 ACCOUNT_OPERATING_INCOME_KEY = ACCOUNT_KEYS[1]
@@ -655,8 +1215,25 @@ ACCOUNT_LIABILITIES_KEY = ACCOUNT_KEYS[4]
 ACCOUNT_EQUITY_KEY = ACCOUNT_KEYS[5]
 
 
+_AMOUNT_RE = re.compile(r"(\()?(-)?(\d[\d,]*)(?:\.\d*)?(\))?")
+# Exactly what f"{amount:,}" produces for an int: no leading zeros, no "-0", 3-digit groups.
+_FORMATTED_AMOUNT_RE = re.compile(r"0|-?[1-9]\d{0,2}(?:,\d{3})*")
+
+
 def parse_amount(value) -> Optional[int]:
-    if value in (None, "", "-", "NaN"):
+    if value is None:
+        return None
+    if isinstance(value, int) and not isinstance(value, bool):
+        return value
+    if isinstance(value, str):
+        # Fast path for the usual DART shapes: "1,234", "-1,234.5", "(1,234)".
+        match = _AMOUNT_RE.fullmatch(value.strip())
+        if match:
+            open_paren, minus, digits, close_paren = match.groups()
+            if bool(open_paren) == bool(close_paren) and not (open_paren and minus):
+                amount = int(digits.replace(",", ""))
+                return -amount if (open_paren or minus) else amount
+    if value in ("", "-", "NaN"):
         return None
     text = str(value).strip().replace(",", "")
     if not text:
@@ -670,9 +1247,21 @@ def parse_amount(value) -> Optional[int]:
 
 
 def parse_float(value) -> Optional[float]:
-    if value in (None, "", "-", "NaN"):
+    if value is None:
+        return None
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return float(value)
+    if isinstance(value, str):
+        return _parse_float_text(value)
+    return _parse_float_text(str(value))
+
+
+@lru_cache(maxsize=8192)
+def _parse_float_text(value: str) -> Optional[float]:
+    # Scan filters re-parse the same PER/PBR/ratio strings on every click, so results are memoized.
+    if value in ("", "-", "NaN", "N/A"):
         return None
-    text = str(value).strip().replace(",", "").replace("%", "")
+    text = value.strip().replace(",", "").replace("%", "")
     if not text:
         return None
     if text.startswith("(") and text.endswith(")"):
@@ -683,7 +1272,11 @@ def parse_float(value) -> Optional[float]:
         return None
 
 
+@lru_cache(maxsize=4096, typed=True)
 def format_amount(value) -> str:
+    # DART usually sends amounts already formatted as "1,234,567"; hand those back untouched.
+    if isinstance(value, str) and _FORMATTED_AMOUNT_RE.fullmatch(value):
+        return value
     amount = parse_amount(value)
     if amount is None:
         return "N/A"
@@ -725,15 +1318,11 @@ def find_account_amount(entries, target_key: str) -> Optional[int]:
     """Find the first matching account amount for the target key using alias map."""
     if not entries:
         return None
-    normalized_target = normalize_name(target_key)
+    # Normalized aliases of target_key plus the normalized key itself (direct match without an alias).
+    matching_names = _account_match_table((target_key,))[0]
     for row in entries:
         account_nm = (row.get("account_nm") or "").strip()
-        if not account_nm:
-            continue
-        normalized_name = normalize_name(account_nm)
-        key = ACCOUNT_ALIAS_MAP.get(normalized_name)
-        # Allow direct normalized match even when alias map is missing.
-        if not ((key and key == target_key) or (normalized_name == normalized_target)):
+        if not account_nm or normalize_name(account_nm) not in matching_names:
             continue
         val = row.get("thstrm_amount") or row.get("thstrm_add_amount")
         amt = parse_amount(val)
@@ -742,20 +1331,98 @@ def find_account_amount(entries, target_key: str) -> Optional[int]:
     return None
 
 
-def summarize_accounts(entries) -> Dict[str, str]:
-    summary = {key: "N/A" for key in ACCOUNT_SYNONYMS}
-    for row in entries or []:
-        account_nm = (row.get("account_nm") or "").strip()
-        if not account_nm:
+def normalized_account_rows(entries) -> List[Tuple[str, Dict]]:
+    """Pair each DART row that has an account name with its normalized name.
+
+    Lets summarize_accounts/extract_accounts share one normalization pass over the same report.
+    """
+    return list(_iter_normalized_account_rows(entries))
+
+
+def _iter_normalized_account_rows(entries) -> Iterable[Tuple[str, Dict]]:
+    # Lazy so summarize_accounts/extract_accounts stop normalizing once every target is filled.
+    for row in entries or ():
+        account_nm = row.get("account_nm")
+        if account_nm:
+            yield normalize_name(account_nm.strip()), row
+
+
+def extract_accounts(
+    entries, targets: Iterable[str], normalized: Optional[List[Tuple[str, Dict]]] = None
+) -> Dict[str, int]:
+    """Single-pass find_account_amount for several target keys at once.
+
+    Returns {target_key: amount} for every target that has a parsable amount; rows are
+    matched exactly as find_account_amount does, and the first hit per target wins.
+    normalized may carry normalized_account_rows(entries) computed by the caller.
+    """
+    found: Dict[str, int] = {}
+    if not entries:
+        return found
+    keys_by_norm, wanted_count = _account_match_table(tuple(targets))
+    keys_get = keys_by_norm.get
+    for norm, row in normalized if normalized is not None else _iter_normalized_account_rows(entries):
+        keys = keys_get(norm)
+        if keys is None:
+            continue
+        keys = keys.difference(found)
+        if not keys:
             continue
-        label = ACCOUNT_ALIAS_MAP.get(normalize_name(account_nm))
-        if not label or summary[label] != "N/A":
+        amount = parse_amount(row.get("thstrm_amount") or row.get("thstrm_add_amount"))
+        if amount is None:
             continue
-        summary[label] = format_amount(row.get("thstrm_amount") or row.get("thstrm_add_amount"))
+        for key in keys:
+            found[key] = amount
+        if len(found) == wanted_count:
+            break
+    return found
+
+
+@lru_cache(maxsize=32)
+def _account_match_table(targets: Tuple[str, ...]) -> Tuple[Dict[str, FrozenSet[str]], int]:
+    """Map every normalized account name to the targets it satisfies (alias or direct match)."""
+    wanted = set(targets)
+    table: Dict[str, Set[str]] = {}
+    for alias, key in ACCOUNT_ALIAS_MAP.items():
+        if key in wanted:
+            table.setdefault(alias, set()).add(key)
+    for target in wanted:
+        table.setdefault(sys.intern(normalize_name(target)), set()).add(target)
+    table.pop("", None)
+    return {norm: frozenset(keys) for norm, keys in table.items()}, len(wanted)
+
+
+def summarize_accounts(entries, normalized: Optional[List[Tuple[str, Dict]]] = None) -> Dict[str, str]:
+    summary = dict.fromkeys(ACCOUNT_SYNONYMS, "N/A")
+    remaining = len(summary)
+    if not entries:
+        return summary
+    alias_get = ACCOUNT_ALIAS_MAP.get
+    fmt = format_amount
+    for norm, row in normalized if normalized is not None else _iter_normalized_account_rows(entries):
+        label = alias_get(norm)
+        if label is None or summary[label] != "N/A":
+            continue
+        value = fmt(row.get("thstrm_amount") or row.get("thstrm_add_amount"))
+        if value == "N/A":
+            continue
+        summary[label] = value
+        remaining -= 1
+        if not remaining:
+            break
     return summary
 
 
+def _dart_get(url: str, params: Dict[str, str]) -> requests.Response:
+    _DART_RATE_LIMITER.wait()
+    return _HTTP_SESSION.get(url, params=params, timeout=15)
+
+
 def fetch_dart_single_accounts(corp_code: str, bsns_year: str, reprt_code: str):
+    cache_file = _dart_report_cache_file("single", corp_code, bsns_year, reprt_code)
+    cached = _read_dart_report_cache(cache_file)
+    if cached is not None:
+        return cached
     params = {
         "crtfc_key": get_dart_key(),
         "corp_code": corp_code,
@@ -763,49 +1430,46 @@ def fetch_dart_single_accounts(corp_code: str, bsns_year: str, reprt_code: str):
         "reprt_code": reprt_code,
         "fs_div": "CFS",
     }
-    resp = requests.get(DART_SINGLE_ACNT_URL, params=params, timeout=15)
+    resp = _dart_get(DART_SINGLE_ACNT_URL, params)
     if resp.status_code != 200:
         raise DartError(f"단일계정 조회 실패: HTTP {resp.status_code}")
-    payload = resp.json()
+    payload = _json(resp)
     if payload.get("status") != "000":
         raise DartError(f"단일계정 조회 오류: {payload.get('status')} {payload.get('message', '')}".strip())
-    return payload.get("list") or []
+    entries = payload.get("list") or []
+    if entries and DART_REPORT_CACHE_MAX_AGE_SECONDS:
+        _write_lookup_cache(cache_file, entries)
+    return entries
 
 
 def _fetch_dart_annual_values(
     corp_code: str, bsns_year: str
 ) -> Tuple[Optional[int], Optional[int], Optional[int]]:
-    params = {
-        "crtfc_key": get_dart_key(),
-        "corp_code": corp_code,
-        "bsns_year": bsns_year,
-        "reprt_code": "11011",
-    }
-    resp = requests.get(DART_MULTI_ACNT_URL, params=params, timeout=15)
-    if resp.status_code != 200:
-        return None, None
-    payload = resp.json()
-    if payload.get("status") != "000":
-        return None, None
-    entries = payload.get("list") or []
+    base_params = {"crtfc_key": get_dart_key(), "corp_code": corp_code}
+    entries, _ = _fetch_dart_period_entries(base_params, bsns_year, "11011")
     if not entries:
-        return None, None
+        return None, None, None
     single_entries = []
     try:
         single_entries = fetch_dart_single_accounts(corp_code, bsns_year, "11011")
     except Exception:
         single_entries = []
     combined = (single_entries or []) + (entries or [])
-    revenue_val = find_account_amount(combined, ACCOUNT_REVENUE_KEY)
-    op_income_val = find_account_amount(combined, ACCOUNT_OPERATING_INCOME_KEY)
-    net_income_val = find_account_amount(combined, ACCOUNT_NET_INCOME_KEY)
-    return revenue_val, op_income_val, net_income_val
+    amounts = extract_accounts(
+        combined, (ACCOUNT_REVENUE_KEY, ACCOUNT_OPERATING_INCOME_KEY, ACCOUNT_NET_INCOME_KEY)
+    )
+    return (
+        amounts.get(ACCOUNT_REVENUE_KEY),
+        amounts.get(ACCOUNT_OPERATING_INCOME_KEY),
+        amounts.get(ACCOUNT_NET_INCOME_KEY),
+    )
 
 
 def collect_dart_annual_series(
-    corp_code: str, window_years: int = 5
+    corp_code: str, window_years: int = 5, executor: Optional[ThreadPoolExecutor] = None
 ) -> Tuple[Dict[int, Optional[int]], Dict[int, Optional[int]], Dict[int, Optional[int]]]:
-    today = datetime.date.today()
+    """Return revenue/operating income/net income by business year; years are fetched on executor if given."""
+    today = _today()
     current_year = today.year
     target_years: List[int] = []
     for year in range(current_year, current_year - 12, -1):
@@ -820,11 +1484,17 @@ def collect_dart_annual_series(
     op_by_year: Dict[int, Optional[int]] = {year: None for year in target_years}
     net_by_year: Dict[int, Optional[int]] = {year: None for year in target_years}
 
-    for year in target_years:
+    def fetch_year(year: int):
         try:
-            revenue_val, op_income_val, net_income_val = _fetch_dart_annual_values(corp_code, str(year))
+            return _fetch_dart_annual_values(corp_code, str(year))
         except Exception:
+            return None
+
+    results = executor.map(fetch_year, target_years) if executor else map(fetch_year, target_years)
+    for year, values in zip(target_years, results):
+        if values is None:
             continue
+        revenue_val, op_income_val, net_income_val = values
         revenue_by_year[year] = revenue_val
         op_by_year[year] = op_income_val
         net_by_year[year] = net_income_val
@@ -833,8 +1503,14 @@ def collect_dart_annual_series(
 
 
 def _parse_int(value) -> Optional[int]:
+    if isinstance(value, int) and not isinstance(value, bool):
+        return value
+    text = str(value).replace(",", "")
+    # Plain digit strings (share counts) skip the float round-trip and its precision loss.
+    if text.isascii() and text.isdigit():
+        return int(text)
     try:
-        return int(float(str(value).replace(",", "")))
+        return int(float(text))
     except Exception:
         return None
 
@@ -893,21 +1569,27 @@ def parse_stock_totals(entries) -> Optional[int]:
 
 
 def fetch_dart_stock_totals(corp_code: str, bsns_year: str, reprt_code: str) -> Optional[int]:
+    cache_file = _dart_report_cache_file("stock_totals", corp_code, bsns_year, reprt_code)
+    cached = _read_dart_report_cache(cache_file)
+    if cached is not None:
+        return parse_stock_totals(cached)
     params = {
         "crtfc_key": get_dart_key(),
         "corp_code": corp_code,
         "bsns_year": bsns_year,
         "reprt_code": reprt_code,
     }
-    resp = requests.get(DART_STOCK_TOT_URL, params=params, timeout=15)
+    resp = _dart_get(DART_STOCK_TOT_URL, params)
     if resp.status_code != 200:
         raise DartError(f"주식 총수 조회 실패: HTTP {resp.status_code}")
 
-    payload = resp.json()
+    payload = _json(resp)
     if payload.get("status") != "000":
         raise DartError(f"주식 총수 조회 오류: {payload.get('status')} {payload.get('message', '')}".strip())
 
     entries = payload.get("list") or []
+    if entries and DART_REPORT_CACHE_MAX_AGE_SECONDS:
+        _write_lookup_cache(cache_file, entries)
     return parse_stock_totals(entries)
 
 
@@ -921,16 +1603,20 @@ def build_report_periods(
     - Includes 분기/반기/3분기 + 사업보고서.
     - Skips unreleased periods when bsns_year is not specified (auto mode).
     """
-    current_date = today or datetime.date.today()
+    current_date = today or _today()
+    # Releases fall on the 1st, so comparing year*12+month ordinals matches comparing dates.
+    current_ordinal = current_date.year * 12 + current_date.month
     candidates = []
 
     def collect_for_year(year: int, skip_unreleased: bool = True):
         year_entries = []
-        for code, release_month, year_offset in REPORT_SCHEDULE:
-            release_date = datetime.date(year + year_offset, release_month, 1)
-            if skip_unreleased and release_date > current_date:
+        year_text = str(year)
+        year_ordinal = year * 12
+        for code, offset in _REPORT_SCHEDULE_ORDINALS:
+            release_ordinal = year_ordinal + offset
+            if skip_unreleased and release_ordinal > current_ordinal:
                 continue
-            year_entries.append((release_date, str(year), code))
+            year_entries.append((release_ordinal, year_text, code))
         return year_entries
 
     try:
@@ -974,15 +1660,27 @@ def fetch_dart_financials(
     recency. Passing reprt_code forces that report type.
     """
     corp_code, corp_name = resolve_dart_corp(user_text)
-    now_year = time.localtime().tm_year
+    now_year = _today().year
     sales_growth_5y = "N/A"
     op_growth_5y = "N/A"
     net_income_growth_5y = "N/A"
     sales_growth_5y_avg_pct = None
     op_growth_5y_avg_pct = None
     net_income_growth_5y_avg_pct = None
+    if reprt_code:
+        years_to_try = [str(bsns_year)] if bsns_year else [str(now_year - i) for i in range(4)]
+        periods = [(year, reprt_code) for year in years_to_try]
+    else:
+        periods = list(build_report_periods(bsns_year=bsns_year, years_back=4))
+        if not periods:
+            periods = [(str(now_year), "11013")]
+
+    executor = _DART_EXECUTOR
+    # Queue the newest report candidates first so they run while the growth series is being collected.
+    base_params = {"crtfc_key": get_dart_key(), "corp_code": corp_code}
+    period_results = _iter_dart_period_entries(executor, base_params, periods)
     try:
-        revenue_series, op_series, net_series = collect_dart_annual_series(corp_code, window_years=5)
+        revenue_series, op_series, net_series = collect_dart_annual_series(corp_code, window_years=5, executor=executor)
         sales_growth_5y_avg_pct, sales_count, sales_transitions = compute_yoy_average_stats(
             revenue_series, window_years=5
         )
@@ -995,62 +1693,138 @@ def fetch_dart_financials(
         net_income_growth_5y = build_yoy_average_text(net_income_growth_5y_avg_pct, net_count, net_transitions)
     except Exception:
         pass
-    if reprt_code:
-        years_to_try = [str(bsns_year)] if bsns_year else [str(now_year - i) for i in range(4)]
-        periods = [(year, reprt_code) for year in years_to_try]
-    else:
-        periods = list(build_report_periods(bsns_year=bsns_year, years_back=4))
-        if not periods:
-            periods = [(str(now_year), "11013")]
 
+    try:
+        return _pick_dart_financials(
+            executor,
+            corp_code,
+            corp_name,
+            period_results,
+            fallback_listed_shares,
+            market_price,
+            {
+                "sales_growth_5y": sales_growth_5y,
+                "op_growth_5y": op_growth_5y,
+                "net_income_growth_5y": net_income_growth_5y,
+                "sales_growth_5y_avg_pct": sales_growth_5y_avg_pct,
+                "op_growth_5y_avg_pct": op_growth_5y_avg_pct,
+                "net_income_growth_5y_avg_pct": net_income_growth_5y_avg_pct,
+            },
+        )
+    finally:
+        period_results.close()
+
+
+# One bounded pool for all lookups: concurrent Range Scan workers queue here instead of
+# each starting DART_FETCH_WORKERS threads behind the same rate limiter.
+_DART_EXECUTOR = ThreadPoolExecutor(max_workers=DART_FETCH_WORKERS, thread_name_prefix="dart")
+
+# Report candidates probed at once; DART's daily quota counts every probe, so keep this small.
+_DART_PERIOD_BATCH = 2
+
+
+def _iter_dart_period_entries(executor: ThreadPoolExecutor, base_params: Dict[str, str], periods):
+    """Yield (year, reprt_code, entries, error) in release order, submitting candidates a batch at a time.
+
+    The first batch is submitted immediately; closing the generator cancels probes that have not started.
+    """
+    futures: List[Future] = []
+
+    def submit_batch() -> None:
+        for year, report_code in periods[len(futures) : len(futures) + _DART_PERIOD_BATCH]:
+            futures.append(executor.submit(_fetch_dart_period_entries, base_params, year, report_code))
+
+    submit_batch()
+    return _drain_dart_period_futures(periods, futures, submit_batch)
+
+
+def _drain_dart_period_futures(periods, futures: List[Future], submit_batch):
+    index = 0
+    try:
+        for year, report_code in periods:
+            if index >= len(futures):
+                submit_batch()
+            entries, error = futures[index].result()
+            index += 1
+            yield year, report_code, entries, error
+    finally:
+        for pending in futures[index:]:
+            pending.cancel()
+
+
+def _fetch_dart_period_entries(
+    base_params: Dict[str, str], year: str, report_code: str
+) -> Tuple[List[Dict], Optional[str]]:
+    """Return (multi-account entries, error) for one (year, reprt_code) candidate."""
+    cache_file = _dart_report_cache_file("multi", base_params["corp_code"], year, report_code)
+    cached = _read_dart_report_cache(cache_file)
+    if cached is not None:
+        return cached, None
+    params = {**base_params, "bsns_year": year, "reprt_code": report_code}
+    resp = _dart_get(DART_MULTI_ACNT_URL, params)
+    if resp.status_code != 200:
+        return [], f"HTTP {resp.status_code}"
+    payload = _json(resp)
+    status = payload.get("status")
+    if status != "000":
+        return [], f"{status} {payload.get('message', '')}".strip()
+    entries = payload.get("list") or []
+    if not entries:
+        return [], "빈 응답"
+    if DART_REPORT_CACHE_MAX_AGE_SECONDS:
+        _write_lookup_cache(cache_file, entries)
+    return entries, None
+
+
+def _pick_dart_financials(
+    executor: ThreadPoolExecutor,
+    corp_code: str,
+    corp_name: str,
+    period_results,
+    fallback_listed_shares: Optional[int],
+    market_price: Optional[float],
+    growth: Dict[str, Any],
+) -> Dict[str, Any]:
+    # Candidate periods are requested a batch ahead but still consumed in release order,
+    # so the most recent available report wins exactly as with the serial loop.
     last_error = None
-    for year, report_code in periods:
-        params = {
-            "crtfc_key": get_dart_key(),
-            "corp_code": corp_code,
-            "bsns_year": year,
-            "reprt_code": report_code,
-        }
-        resp = requests.get(DART_MULTI_ACNT_URL, params=params, timeout=15)
-        if resp.status_code != 200:
-            last_error = f"HTTP {resp.status_code}"
-            continue
-        payload = resp.json()
-        status = payload.get("status")
-        if status != "000":
-            last_error = f"{status} {payload.get('message', '')}".strip()
-            continue
-        entries = payload.get("list") or []
-        if not entries:
-            last_error = "빈 응답"
+    for year, report_code, entries, last_error in period_results:
+        if last_error:
             continue
+        period_results.close()
+
+        single_future = executor.submit(fetch_dart_single_accounts, corp_code, year, report_code)
+        shares_future = executor.submit(fetch_dart_stock_totals, corp_code, year, report_code)
         single_entries = []
         try:
-            single_entries = fetch_dart_single_accounts(corp_code, year, report_code)
+            single_entries = single_future.result()
         except Exception:
             single_entries = []
 
-        summary = summarize_accounts(entries)
+        # Normalize each account name once; the multi-account rows feed both the summary and the amounts.
+        multi_rows = normalized_account_rows(entries)
+        summary = summarize_accounts(entries, multi_rows)
         combined = (single_entries or []) + (entries or [])
-        cash_equivalents = find_account_amount(combined, "현금및현금성자산")
-        short_term_products = find_account_amount(combined, "단기금융상품")
-        amortized_assets = find_account_amount(combined, "단기상각후원가금융자산")
-        fvpl_assets = find_account_amount(combined, "단기당기손익-공정가치금융자산")
-        liabilities_value = find_account_amount(combined, ACCOUNT_LIABILITIES_KEY)
-        equity_value = find_account_amount(combined, ACCOUNT_EQUITY_KEY)
-        net_income_value = find_account_amount(combined, ACCOUNT_NET_INCOME_KEY)
+        amounts = extract_accounts(combined, ACCOUNT_KEYS, normalized_account_rows(single_entries) + multi_rows)
+        cash_equivalents = amounts.get("현금및현금성자산")
+        short_term_products = amounts.get("단기금융상품")
+        amortized_assets = amounts.get("단기상각후원가금융자산")
+        fvpl_assets = amounts.get("단기당기손익-공정가치금융자산")
+        liabilities_value = amounts.get(ACCOUNT_LIABILITIES_KEY)
+        equity_value = amounts.get(ACCOUNT_EQUITY_KEY)
+        net_income_value = amounts.get(ACCOUNT_NET_INCOME_KEY)
 
         if cash_equivalents is not None:
             summary["현금및현금성자산"] = format_amount(cash_equivalents)
 
         liquid_funds = _sum_or_none([cash_equivalents, short_term_products, amortized_assets, fvpl_assets])
 
-        short_borrowings = find_account_amount(combined, "단기차입금")
-        current_long_term_debt = find_account_amount(combined, "유동성장기부채")
-        current_long_term_borrowings = find_account_amount(combined, "유동성장기차입금")
-        current_bonds = find_account_amount(combined, "유동성사채")
-        bonds = find_account_amount(combined, "사채")
-        long_borrowings = find_account_amount(combined, "장기차입금")
+        short_borrowings = amounts.get("단기차입금")
+        current_long_term_debt = amounts.get("유동성장기부채")
+        current_long_term_borrowings = amounts.get("유동성장기차입금")
+        current_bonds = amounts.get("유동성사채")
+        bonds = amounts.get("사채")
+        long_borrowings = amounts.get("장기차입금")
 
         if current_long_term_debt is None:
             current_long_term_debt = _sum_or_none([current_long_term_borrowings, current_bonds])
@@ -1077,63 +1851,29 @@ def fetch_dart_financials(
             except Exception:
                 liabilities_ratio_pct = None
 
-        float_shares = None
+        dart_float_shares = None
         try:
-            float_shares = fetch_dart_stock_totals(corp_code, year, report_code)
+            dart_float_shares = shares_future.result()
         except Exception:
-            float_shares = None
-
-        used_kis_fallback = False
-        if float_shares is None and fallback_listed_shares and fallback_listed_shares > 0:
-            float_shares = fallback_listed_shares
-            used_kis_fallback = True
-
-        net_cash_per_share_value = None
-        if net_cash is not None and float_shares:
-            try:
-                net_cash_per_share_value = net_cash / float_shares
-            except Exception:
-                net_cash_per_share_value = None
-
-        net_cash_per_share = format_per_share(net_cash, float_shares)
-        if used_kis_fallback and net_cash_per_share != "N/A":
-            net_cash_per_share = f"{net_cash_per_share} (KIS 상장주식수)"
-
-        net_cash_per_share_ratio = "N/A"
-        if net_cash_per_share_value is not None and market_price and market_price > 0:
-            try:
-                ratio = (net_cash_per_share_value / market_price) * 100
-                net_cash_per_share_ratio = f"{ratio:,.2f}%"
-            except Exception:
-                net_cash_per_share_ratio = "N/A"
+            dart_float_shares = None
 
         net_cash_display = format_amount(net_cash) if net_cash is not None else "N/A"
-        float_shares_display = format_amount(float_shares) if float_shares is not None else None
         ib_debt_ratio_text = f"{ib_debt_ratio_pct:,.2f}" if ib_debt_ratio_pct is not None else "N/A"
 
-        return {
+        data = {
             "corp_name": corp_name,
             "corp_code": corp_code,
             "bsns_year": year,
             "reprt_code": report_code,
             "summary": summary,
-            "sales_growth_5y": sales_growth_5y,
-            "op_growth_5y": op_growth_5y,
-            "net_income_growth_5y": net_income_growth_5y,
-            "sales_growth_5y_avg_pct": sales_growth_5y_avg_pct,
-            "op_growth_5y_avg_pct": op_growth_5y_avg_pct,
-            "net_income_growth_5y_avg_pct": net_income_growth_5y_avg_pct,
+            **growth,
             "cash_equivalents": format_amount(cash_equivalents) if cash_equivalents is not None else "N/A",
             "liquid_funds": liquid_funds,
             "interest_bearing_debt": debt_value,
             "liabilities": liabilities_value,
             "net_cash": net_cash,
             "net_cash_display": net_cash_display,
-            "float_shares": float_shares,
-            "float_shares_display": float_shares_display,
-            "net_cash_per_share": net_cash_per_share,
-            "net_cash_per_share_value": net_cash_per_share_value,
-            "net_cash_per_share_ratio": net_cash_per_share_ratio,
+            "dart_float_shares": dart_float_shares,
             "equity": equity_value,
             "net_income": net_income_value,
             "liabilities_ratio": f"{liabilities_ratio_pct:,.2f}" if liabilities_ratio_pct is not None else "N/A",
@@ -1141,10 +1881,57 @@ def fetch_dart_financials(
             "interest_bearing_debt_ratio": ib_debt_ratio_text,
             "interest_bearing_debt_ratio_value": ib_debt_ratio_pct,
         }
+        return apply_dart_market_inputs(data, fallback_listed_shares, market_price)
 
     raise DartError(last_error or "조회 가능한 연도가 없습니다.")
 
 
+def apply_dart_market_inputs(
+    data: Dict[str, Any],
+    fallback_listed_shares: Optional[int] = None,
+    market_price: Optional[float] = None,
+) -> Dict[str, Any]:
+    """Return a copy of a DART result with the share-count and price dependent fields filled in.
+
+    This lets the GUI fetch DART and KIS side by side and merge the KIS listed shares
+    (used when DART has no float count) and price afterwards.
+    """
+    net_cash = data.get("net_cash")
+    float_shares = data.get("dart_float_shares")
+    used_kis_fallback = False
+    if float_shares is None and fallback_listed_shares and fallback_listed_shares > 0:
+        float_shares = fallback_listed_shares
+        used_kis_fallback = True
+
+    net_cash_per_share_value = None
+    if net_cash is not None and float_shares:
+        try:
+            net_cash_per_share_value = net_cash / float_shares
+        except Exception:
+            net_cash_per_share_value = None
+
+    net_cash_per_share = format_per_share(net_cash, float_shares)
+    if used_kis_fallback and net_cash_per_share != "N/A":
+        net_cash_per_share = f"{net_cash_per_share} (KIS 상장주식수)"
+
+    net_cash_per_share_ratio = "N/A"
+    if net_cash_per_share_value is not None and market_price and market_price > 0:
+        try:
+            ratio = (net_cash_per_share_value / market_price) * 100
+            net_cash_per_share_ratio = f"{ratio:,.2f}%"
+        except Exception:
+            net_cash_per_share_ratio = "N/A"
+
+    return {
+        **data,
+        "float_shares": float_shares,
+        "float_shares_display": format_amount(float_shares) if float_shares is not None else None,
+        "net_cash_per_share": net_cash_per_share,
+        "net_cash_per_share_value": net_cash_per_share_value,
+        "net_cash_per_share_ratio": net_cash_per_share_ratio,
+    }
+
+
 
 @lru_cache(maxsize=128)
 def load_company_facts(cik: str) -> Dict:
@@ -1155,12 +1942,11 @@ def load_company_facts(cik: str) -> Dict:
     local_path = find_local_companyfacts_file(cik_padded)
     if local_path:
         try:
-            with local_path.open("r", encoding="utf-8") as handle:
-                return json.load(handle)
+            return _json_loads(local_path.read_bytes())
         except Exception as exc:
             raise EdgarError(f"Failed to read local company facts: {local_path}: {exc}") from exc
 
-    resp = requests.get(SEC_FACTS_URL.format(cik=cik_padded), headers=sec_headers(), timeout=15)
+    resp = _HTTP_SESSION.get(SEC_FACTS_URL.format(cik=cik_padded), headers=sec_headers(), timeout=15)
     if resp.status_code != 200:
         if resp.status_code == 403:
             raise EdgarError(
@@ -1168,53 +1954,37 @@ def load_company_facts(cik: str) -> Dict:
             )
         raise EdgarError(f"Failed to fetch company facts: HTTP {resp.status_code}")
     try:
-        return resp.json()
+        return _json(resp)
     except Exception as exc:
         raise EdgarError(f"Invalid company facts payload: {exc}") from exc
 
 
+@lru_cache(maxsize=4096)
 def _parse_iso_date(date_text: str) -> int:
+    # companyfacts repeats the same few period-end/filed dates across thousands of facts.
     try:
         return datetime.date.fromisoformat(date_text).toordinal()
     except Exception:
         return 0
 
 
+_SEC_FORM_PRIORITY_MAP = {form: idx for idx, form in enumerate(SEC_FORM_PRIORITY)}
+
+
+def _form_priority_map(forms_priority) -> Dict[str, int]:
+    """Form -> rank; the default SEC order is built once at import, custom orders per call."""
+    if forms_priority is SEC_FORM_PRIORITY:
+        return _SEC_FORM_PRIORITY_MAP
+    return {form: idx for idx, form in enumerate(forms_priority)}
+
+
 def _extract_latest_fact(
     facts: Dict,
     key: str,
     units=("USD",),
     forms_priority=SEC_FORM_PRIORITY,
 ) -> Optional[float]:
-    facts_root = (facts or {}).get("facts", {}).get("us-gaap", {})
-    entry = facts_root.get(key) or {}
-    unit_map = entry.get("units") or {}
-    candidates = []
-    priority_map = {form: idx for idx, form in enumerate(forms_priority)}
-
-    today_ord = datetime.date.today().toordinal()
-
-    for unit in units:
-        for item in unit_map.get(unit, []):
-            val = item.get("val")
-            if val in (None, "", "-", "NaN"):
-                continue
-            try:
-                val_num = float(val)
-            except Exception:
-                continue
-            form = item.get("form", "")
-            priority = priority_map.get(form, len(forms_priority))
-            end_ts = _parse_iso_date(item.get("end") or "") or _parse_iso_date(item.get("filed") or "")
-            # Skip future-dated facts that can appear in companyfacts payloads.
-            if end_ts and end_ts > today_ord:
-                continue
-            candidates.append((priority, end_ts, val_num))
-
-    if not candidates:
-        return None
-    best = min(candidates, key=lambda c: (c[0], -c[1]))
-    return best[2]
+    return _extract_latest_fact_multi(facts, (key,), units=units, forms_priority=forms_priority)
 
 
 def _extract_latest_fact_any(
@@ -1231,6 +2001,21 @@ def _extract_latest_fact_any(
     return None
 
 
+def _pick_latest_fact(facts: Dict, tags) -> Tuple[Optional[int], Optional[str]]:
+    """Return (integer value, tag) for the first tag in order that has a usable latest fact.
+
+    Each tag is one direct concept lookup; tags the filer never reported are skipped without a walk.
+    """
+    facts_root = (facts or {}).get("facts", {}).get("us-gaap", {})
+    for tag in tags:
+        if tag not in facts_root:
+            continue
+        val = _extract_latest_fact(facts, tag)
+        if val is not None:
+            return _parse_int(val), tag
+    return None, None
+
+
 def _extract_latest_fact_multi(
     facts: Dict,
     keys,
@@ -1239,9 +2024,12 @@ def _extract_latest_fact_multi(
 ) -> Optional[float]:
     """Choose the latest/most-prioritized fact across multiple keys."""
     facts_root = (facts or {}).get("facts", {}).get("us-gaap", {})
-    priority_map = {form: idx for idx, form in enumerate(forms_priority)}
-    candidates = []
-    today_ord = datetime.date.today().toordinal()
+    priority_map = _form_priority_map(forms_priority)
+    missing_priority = len(forms_priority)
+    today_ord = _today().toordinal()
+    # Running argmin of (form priority, -end date); ties keep the first fact seen.
+    best_rank: Optional[Tuple[int, int]] = None
+    best_val: Optional[float] = None
 
     for key in keys:
         entry = facts_root.get(key) or {}
@@ -1255,17 +2043,16 @@ def _extract_latest_fact_multi(
                     val_num = float(val)
                 except Exception:
                     continue
-                form = item.get("form", "")
-                priority = priority_map.get(form, len(forms_priority))
                 end_ts = _parse_iso_date(item.get("end") or "") or _parse_iso_date(item.get("filed") or "")
+                # Skip future-dated facts that can appear in companyfacts payloads.
                 if end_ts and end_ts > today_ord:
                     continue
-                candidates.append((priority, end_ts, val_num))
+                rank = (priority_map.get(item.get("form", ""), missing_priority), -end_ts)
+                if best_rank is None or rank < best_rank:
+                    best_rank = rank
+                    best_val = val_num
 
-    if not candidates:
-        return None
-    best = min(candidates, key=lambda c: (c[0], -c[1]))
-    return best[2]
+    return best_val
 
 
 def _coerce_year(value) -> Optional[int]:
@@ -1291,9 +2078,9 @@ def _extract_annual_series(
     forms_priority=SEC_FORM_PRIORITY,
 ) -> Dict[int, float]:
     facts_root = (facts or {}).get("facts", {}).get("us-gaap", {})
-    priority_map = {form: idx for idx, form in enumerate(forms_priority)}
+    priority_map = _form_priority_map(forms_priority)
     key_priority = {key: idx for idx, key in enumerate(keys)}
-    today_ord = datetime.date.today().toordinal()
+    today_ord = _today().toordinal()
     per_year: Dict[int, Tuple[int, int, int, float]] = {}
 
     for key in keys:
@@ -1414,7 +2201,7 @@ def fetch_yahoo_quotes_batch(tickers: List[str], *, max_retries: int = 3) -> Dic
 
     last_status = None
     for attempt in range(max_retries + 1):
-        resp = requests.get(YAHOO_QUOTE_URL, params={"symbols": ",".join(symbols)}, timeout=10)
+        resp = _HTTP_SESSION.get(YAHOO_QUOTE_URL, params={"symbols": ",".join(symbols)}, timeout=10)
         last_status = resp.status_code
         if resp.status_code == 200:
             break
@@ -1434,7 +2221,7 @@ def fetch_yahoo_quotes_batch(tickers: List[str], *, max_retries: int = 3) -> Dic
         raise EdgarError(f"Quote request failed: HTTP {last_status}")
 
     try:
-        result = resp.json().get("quoteResponse", {}).get("result", [])
+        result = _json(resp).get("quoteResponse", {}).get("result", [])
     except Exception as exc:
         raise EdgarError(f"Invalid quote response: {exc}") from exc
 
@@ -1462,11 +2249,11 @@ def fetch_yahoo_quote(ticker: str) -> Dict[str, Optional[float]]:
         if not symbol:
             continue
         try:
-            resp = requests.get(YAHOO_QUOTE_URL, params={"symbols": symbol}, timeout=10)
+            resp = _HTTP_SESSION.get(YAHOO_QUOTE_URL, params={"symbols": symbol}, timeout=10)
             if resp.status_code != 200:
                 raise EdgarError(f"Quote request failed: HTTP {resp.status_code}")
             try:
-                result = resp.json().get("quoteResponse", {}).get("result", [])
+                result = _json(resp).get("quoteResponse", {}).get("result", [])
             except Exception as exc:
                 raise EdgarError(f"Invalid quote response: {exc}") from exc
 
@@ -1487,17 +2274,40 @@ def fetch_yahoo_quote(ticker: str) -> Dict[str, Optional[float]]:
     return fetch_stooq_quote(ticker, last_error)
 
 
-@lru_cache(maxsize=1)
+# FX barely moves between lookups; reuse the last quote this long (USDKRW_TTL seconds, 0 disables).
+USDKRW_CACHE_SECONDS = _env_int("USDKRW_TTL", 300)
+_USDKRW_RATE: Optional[Tuple[float, float]] = None
+_USDKRW_RATE_LOCK = threading.Lock()
+
+
 def fetch_usdkrw_rate() -> Optional[float]:
-    """Fetch USD/KRW on each lookup with optional .env override fallback."""
+    """Return USD/KRW (.env override first), cached for USDKRW_CACHE_SECONDS.
+
+    When a refresh fails, the last fetched rate is returned instead of None.
+    """
+    global _USDKRW_RATE
     env_rate = parse_float(os.getenv("USD_KRW_RATE"))
     if env_rate:
         return env_rate
+    with _USDKRW_RATE_LOCK:
+        cached = _USDKRW_RATE
+    if cached is not None and time.monotonic() - cached[0] < USDKRW_CACHE_SECONDS:
+        return cached[1]
+    rate = _fetch_usdkrw_rate_live()
+    if rate is None:
+        return cached[1] if cached is not None else None
+    with _USDKRW_RATE_LOCK:
+        _USDKRW_RATE = (time.monotonic(), rate)
+    return rate
+
+
+def _fetch_usdkrw_rate_live() -> Optional[float]:
+    """Fetch USD/KRW from Yahoo, falling back to the Stooq daily close."""
     try:
-        resp = requests.get(YAHOO_QUOTE_URL, params={"symbols": "USDKRW=X"}, timeout=10)
+        resp = _HTTP_SESSION.get(YAHOO_QUOTE_URL, params={"symbols": "USDKRW=X"}, timeout=10)
         if resp.status_code != 200:
             raise EdgarError(f"USD/KRW request failed: HTTP {resp.status_code}")
-        result = resp.json().get("quoteResponse", {}).get("result", [])
+        result = _json(resp).get("quoteResponse", {}).get("result", [])
         if not result:
             raise EdgarError("USD/KRW quote not found")
         price = result[0].get("regularMarketPrice")
@@ -1508,26 +2318,26 @@ def fetch_usdkrw_rate() -> Optional[float]:
 
     # Fallback: Stooq daily close for usdkrw.
     try:
-        resp = requests.get(STOOQ_QUOTE_URL, params={"s": "usdkrw", "i": "d"}, timeout=10)
+        resp = _HTTP_SESSION.get(STOOQ_QUOTE_URL, params={"s": "usdkrw", "i": "d"}, timeout=10)
         if resp.status_code != 200:
-            return env_rate
+            return None
         lines = resp.text.strip().splitlines()
         if not lines or "," not in lines[0]:
-            return env_rate
+            return None
         parts = lines[0].split(",")
         if len(parts) >= 7:
             close_price = parse_float(parts[6])
             if close_price:
                 return close_price
     except Exception:
-        return env_rate
+        return None
 
-    return env_rate
+    return None
 
 
 def fetch_stooq_quote(ticker: str, yahoo_error: Optional[str] = None) -> Dict[str, Optional[float]]:
     symbol = f"{yahoo_symbol_for_ticker(ticker).lower()}.us"
-    resp = requests.get(STOOQ_QUOTE_URL, params={"s": symbol, "i": "d"}, timeout=10)
+    resp = _HTTP_SESSION.get(STOOQ_QUOTE_URL, params={"s": symbol, "i": "d"}, timeout=10)
     if resp.status_code != 200:
         raise EdgarError(
             f"Quote request failed (Stooq fallback HTTP {resp.status_code}) after Yahoo error: {yahoo_error or 'N/A'}"
@@ -1585,7 +2395,7 @@ def fetch_nasdaq_screener_quotes() -> Dict[str, Dict[str, Optional[float]]]:
         "Origin": "https://www.nasdaq.com",
         "Referer": "https://www.nasdaq.com/",
     }
-    resp = requests.get(
+    resp = _HTTP_SESSION.get(
         NASDAQ_SCREENER_URL,
         params={"tableonly": "true", "download": "true"},
         headers=headers,
@@ -1594,7 +2404,7 @@ def fetch_nasdaq_screener_quotes() -> Dict[str, Dict[str, Optional[float]]]:
     if resp.status_code != 200:
         raise EdgarError(f"Nasdaq screener quote request failed: HTTP {resp.status_code}")
     try:
-        rows = resp.json().get("data", {}).get("rows") or []
+        rows = _json(resp).get("data", {}).get("rows") or []
     except Exception as exc:
         raise EdgarError(f"Invalid Nasdaq screener response: {exc}") from exc
 
@@ -1667,7 +2477,7 @@ def yahoo_scan_symbols(ticker: str, country: str) -> List[str]:
     if country == "US":
         return [yahoo_symbol_for_ticker(base)]
     if country == "KR":
-        digits = "".join(ch for ch in base if ch.isdigit())
+        digits = _NON_DIGITS_RE.sub("", base)
         code = digits[:6] if len(digits) >= 6 else base
         return [f"{code}.KS", f"{code}.KQ"]
     market = GLOBAL_MARKETS.get(country)
@@ -1684,7 +2494,7 @@ def primary_yahoo_scan_symbol(ticker: str, country: str) -> str:
 def normalize_scan_code_for_country(code: str, country: str) -> str:
     text = (code or "").strip().upper()
     if country == "KR":
-        digits = "".join(ch for ch in text if ch.isdigit())
+        digits = _NON_DIGITS_RE.sub("", text)
         return digits[:6] if len(digits) >= 6 else text
     if country == "JP":
         return normalize_jp_code(text)
@@ -1705,14 +2515,14 @@ def fetch_yahoo_quote_summary(symbol: str) -> Dict[str, Any]:
             "incomeStatementHistory",
         )
     )
-    resp = requests.get(
+    resp = _HTTP_SESSION.get(
         YAHOO_QUOTE_SUMMARY_URL.format(symbol=symbol),
         params={"modules": modules},
         timeout=12,
     )
     if resp.status_code != 200:
         raise EdgarError(f"Yahoo summary request failed: HTTP {resp.status_code}")
-    payload = resp.json().get("quoteSummary", {})
+    payload = _json(resp).get("quoteSummary", {})
     error = payload.get("error")
     if error:
         raise EdgarError(f"Yahoo summary error: {error}")
@@ -1846,8 +2656,8 @@ class JQuantsClient:
         self.session = requests.Session()
         self._id_token: Optional[str] = None
         self._last_request_at = 0.0
-        self.requests_per_minute = max(1, int(os.getenv("JQUANTS_REQUESTS_PER_MINUTE", "5") or "5"))
-        self.max_retries = max(0, int(os.getenv("JQUANTS_MAX_RETRIES", "6") or "6"))
+        self.requests_per_minute = _env_int("JQUANTS_REQUESTS_PER_MINUTE", 5, minimum=1)
+        self.max_retries = _env_int("JQUANTS_MAX_RETRIES", 6)
 
     def _request(self, method: str, path: str, **kwargs) -> requests.Response:
         url = f"{self.base_url}{path}"
@@ -1883,7 +2693,7 @@ class JQuantsClient:
             resp = self._request("POST", "/v1/token/auth_refresh", params={"refreshtoken": self.refresh_token})
             if resp.status_code != 200:
                 raise OfficialDataError(f"J-Quants auth_refresh failed: HTTP {resp.status_code} {resp.text}")
-            self._id_token = resp.json().get("idToken")
+            self._id_token = _json(resp).get("idToken")
             if not self._id_token:
                 raise OfficialDataError("J-Quants auth_refresh response missing idToken.")
             return self._id_token
@@ -1894,13 +2704,13 @@ class JQuantsClient:
         )
         if resp.status_code != 200:
             raise OfficialDataError(f"J-Quants auth_user failed: HTTP {resp.status_code} {resp.text}")
-        refresh_token = resp.json().get("refreshToken")
+        refresh_token = _json(resp).get("refreshToken")
         if not refresh_token:
             raise OfficialDataError("J-Quants auth_user response missing refreshToken.")
         resp = self._request("POST", "/v1/token/auth_refresh", params={"refreshtoken": refresh_token})
         if resp.status_code != 200:
             raise OfficialDataError(f"J-Quants auth_refresh failed: HTTP {resp.status_code} {resp.text}")
-        self._id_token = resp.json().get("idToken")
+        self._id_token = _json(resp).get("idToken")
         if not self._id_token:
             raise OfficialDataError("J-Quants auth_refresh response missing idToken.")
         return self._id_token
@@ -1923,7 +2733,7 @@ class JQuantsClient:
             resp = self._request("GET", path, headers=self._headers(), params=request_params)
             if resp.status_code != 200:
                 raise OfficialDataError(f"J-Quants request failed ({path}): HTTP {resp.status_code} {resp.text}")
-            payload = resp.json()
+            payload = _json(resp)
             all_rows.extend(payload.get("data") or [])
             next_key = payload.get("pagination_key")
             if not next_key:
@@ -1936,7 +2746,7 @@ class JQuantsClient:
         resp = self._request("GET", "/v1/listed/info", headers=self._headers(), params=params)
         if resp.status_code != 200:
             raise OfficialDataError(f"J-Quants listed info failed: HTTP {resp.status_code} {resp.text}")
-        return resp.json().get("info") or []
+        return _json(resp).get("info") or []
 
     def get_statements(self, code: str) -> List[Dict[str, Any]]:
         if self._is_v2():
@@ -1944,7 +2754,7 @@ class JQuantsClient:
         resp = self._request("GET", "/v1/fins/statements", headers=self._headers(), params={"code": code})
         if resp.status_code != 200:
             raise OfficialDataError(f"J-Quants statements failed: HTTP {resp.status_code} {resp.text}")
-        return resp.json().get("statements") or []
+        return _json(resp).get("statements") or []
 
     def get_daily_quotes(self, code: str) -> List[Dict[str, Any]]:
         if self._is_v2():
@@ -1952,14 +2762,14 @@ class JQuantsClient:
         resp = self._request("GET", "/v1/prices/daily_quotes", headers=self._headers(), params={"code": code})
         if resp.status_code != 200:
             raise OfficialDataError(f"J-Quants daily quotes failed: HTTP {resp.status_code} {resp.text}")
-        return resp.json().get("daily_quotes") or []
+        return _json(resp).get("daily_quotes") or []
 
 
 def normalize_jp_code(user_text: str) -> str:
     code = (user_text or "").strip().upper()
     code = code[:-2] if code.endswith(".T") else code
-    code = re.sub(r"[^0-9A-Z]", "", code)
-    if not re.fullmatch(r"[0-9A-Z]{4,5}", code):
+    code = _NON_JP_CODE_CHARS_RE.sub("", code)
+    if not _JP_CODE_RE.fullmatch(code):
         raise OfficialDataError("Enter a 4- or 5-character Japanese stock code, e.g. 7203, 130A, or 25935.")
     if len(code) == 5 and code.endswith("0"):
         return code[:4]
@@ -1970,7 +2780,7 @@ def normalize_jp_listed_code(raw_code: str) -> str:
     code = normalize_jp_code(raw_code)
     # J-Quants listed-info rows may include exchange suffixes such as 72030 for
     # normal 4-digit stocks. JPX 5-character class share codes must be preserved.
-    if re.fullmatch(r"\d{5}", code) and code.endswith("0"):
+    if _FIVE_DIGITS_RE.fullmatch(code) and code.endswith("0"):
         return code[:4]
     return code
 
@@ -2087,7 +2897,7 @@ def jquants_statement_year(entry: Dict[str, Any]) -> Optional[int]:
     year = _coerce_year(value)
     if year is not None:
         return year
-    match = re.match(r"\s*(\d{4})", str(value or ""))
+    match = _LEADING_YEAR_RE.match(str(value or ""))
     return int(match.group(1)) if match else None
 
 
@@ -2408,7 +3218,17 @@ def fetch_global_financials(
     return snapshot, detail
 
 
+_CLEAN_NUMBER_PLACEHOLDERS = frozenset({"", "-", "N/A"})
+
+
 def clean_number(val: str) -> str:
+    # Placeholder cells are common in KIS/DART payloads; skip the float() exception for them.
+    if val is None:
+        return "None"
+    if isinstance(val, float) or (isinstance(val, int) and not isinstance(val, bool)):
+        return f"{float(val):,}"
+    if isinstance(val, str) and val in _CLEAN_NUMBER_PLACEHOLDERS:
+        return val
     try:
         return f"{float(val):,}"
     except (ValueError, TypeError):
@@ -2452,7 +3272,7 @@ def export_rows_to_spreadsheet(path: str, headers: List[str], rows: List[Tuple[A
 
 def env_ticker_list(env_name: str) -> List[str]:
     raw = os.getenv(env_name, "")
-    return [t.strip().upper() for t in re.split(r"[\s,;]+", raw) if t.strip()]
+    return [t.strip().upper() for t in _LIST_SEPARATORS_RE.split(raw) if t.strip()]
 
 
 def load_symbol_file(path: Path) -> List[str]:
@@ -2465,11 +3285,11 @@ def load_symbol_file(path: Path) -> List[str]:
                 reader.fieldnames[0],
             )
             return [str(row.get(code_field) or "").strip() for row in reader if str(row.get(code_field) or "").strip()]
-    return [item.strip() for item in re.split(r"[\s,;]+", text) if item.strip()]
+    return [item.strip() for item in _LIST_SEPARATORS_RE.split(text) if item.strip()]
 
 
 def load_asx_tickers() -> List[Dict[str, str]]:
-    resp = requests.get(ASX_LISTED_COMPANIES_URL, timeout=20)
+    resp = _HTTP_SESSION.get(ASX_LISTED_COMPANIES_URL, timeout=20)
     if resp.status_code != 200:
         raise EdgarError(f"Failed to load ASX listed companies: HTTP {resp.status_code}")
     text = resp.content.decode("utf-8-sig", errors="ignore")
@@ -2689,7 +3509,7 @@ def load_cached_codes(path: Path) -> set:
     with path.open("r", encoding="utf-8") as f:
         for line in f:
             try:
-                payload = json.loads(line)
+                payload = _json_loads(line)
                 code = str(payload.get("code") or "").strip()
                 if code:
                     codes.add(code)
@@ -2705,7 +3525,7 @@ def load_fundamentals_cache(path: Path) -> List[Dict[str, Any]]:
     with path.open("r", encoding="utf-8") as f:
         for line in f:
             try:
-                payload = json.loads(line)
+                payload = _json_loads(line)
                 if payload.get("code"):
                     records.append(payload)
             except Exception:
@@ -3268,7 +4088,7 @@ def _local_name(tag: str) -> str:
 def _parse_xbrl_number(value: Any, scale: Optional[str] = None, sign: Optional[str] = None) -> Optional[float]:
     if value in (None, "", "-", "NaN"):
         return None
-    text = re.sub(r"\s+", "", str(value)).replace(",", "")
+    text = _WHITESPACE_RE.sub("", str(value)).replace(",", "")
     if not text:
         return None
     if text.startswith("(") and text.endswith(")"):
@@ -3288,6 +4108,8 @@ def _parse_xbrl_number(value: Any, scale: Optional[str] = None, sign: Optional[s
 
 
 def _parse_xbrl_xml(xml_text: str) -> Dict[str, Any]:
+    import xml.etree.ElementTree as ET  # deferred: only the UK cache builder parses XBRL
+
     parser = ET.XMLParser()
     root = ET.fromstring(xml_text.encode("utf-8"), parser=parser)
     contexts: Dict[str, Dict[str, Any]] = {}
@@ -3352,23 +4174,23 @@ def _parse_xbrl_xml(xml_text: str) -> Dict[str, Any]:
     return {"facts": facts}
 
 
-def _read_esef_documents(input_path: Path) -> List[Tuple[str, str]]:
+def _iter_esef_documents(input_path: Path) -> Iterable[Tuple[str, str]]:
+    """Yield (source name, text) for each ESEF document, reading zip members one at a time.
+
+    The builder stops at the first document that parses, so later members are never decompressed.
+    """
     if input_path.is_dir():
-        docs = []
         for child in input_path.rglob("*"):
-            if child.suffix.lower() in (".html", ".xhtml", ".xml"):
-                docs.extend(_read_esef_documents(child))
-            elif child.suffix.lower() == ".zip":
-                docs.extend(_read_esef_documents(child))
-        return docs
+            if child.suffix.lower() in (".html", ".xhtml", ".xml", ".zip"):
+                yield from _iter_esef_documents(child)
+        return
     if input_path.suffix.lower() == ".zip":
-        docs = []
         with zipfile.ZipFile(input_path) as zf:
             for name in zf.namelist():
                 if name.lower().endswith((".html", ".xhtml", ".xml")):
-                    docs.append((name, zf.read(name).decode("utf-8", errors="ignore")))
-        return docs
-    return [(input_path.name, input_path.read_text(encoding="utf-8", errors="ignore"))]
+                    yield name, zf.read(name).decode("utf-8", errors="ignore")
+        return
+    yield input_path.name, input_path.read_text(encoding="utf-8", errors="ignore")
 
 
 def _fact_latest(facts: Dict[str, List[Dict[str, Any]]], names: Tuple[str, ...]) -> Optional[float]:
@@ -3416,7 +4238,7 @@ def _fact_latest_item(
 
 
 def _unit_currency(unit: Any) -> str:
-    for part in re.split(r"[,/ ]+", str(unit or "").upper()):
+    for part in _UNIT_SEPARATORS_RE.split(str(unit or "").upper()):
         if part in {"GBP", "USD", "EUR"}:
             return part
     return ""
@@ -3450,7 +4272,7 @@ def _uk_latest_share_count(facts: Dict[str, List[Dict[str, Any]]]) -> Tuple[Opti
         if any(token in lower for token in ("pershare", "sharebased", "treasury", "dividend", "premium", "reserve")):
             continue
         for fact in items:
-            unit_parts = [p for p in re.split(r"[,/ ]+", str(fact.get("unit") or "").lower()) if p]
+            unit_parts = [p for p in _UNIT_SEPARATORS_RE.split(str(fact.get("unit") or "").lower()) if p]
             if unit_parts and unit_parts != ["shares"]:
                 continue
             value = fact.get("value")
@@ -3684,29 +4506,28 @@ def build_uk_fundamentals_cache(
         for input_idx, raw_path in enumerate(input_list):
             input_path = Path(raw_path.strip().strip('"'))
             try:
-                documents = _read_esef_documents(input_path)
+                for doc_idx, (source, text) in enumerate(_iter_esef_documents(input_path)):
+                    total += 1
+                    code = ticker_list[input_idx] if input_idx < len(ticker_list) else input_path.stem.upper()
+                    if code in cached_codes:
+                        continue
+                    name = name_list[input_idx] if input_idx < len(name_list) else code
+                    try:
+                        parsed = _parse_xbrl_xml(text)
+                        record = uk_facts_to_cache_record(code, name, source, parsed)
+                        out.write(json.dumps(record, ensure_ascii=False) + "\n")
+                        out.flush()
+                        cached_codes.add(code)
+                        written += 1
+                        print(f"[{written}] cached UK {code} from {source}")
+                        break
+                    except Exception as exc:
+                        last_error = str(exc)
+                        print(f"failed UK document {source}: {exc}", file=sys.stderr)
             except Exception as exc:
+                # Documents are read lazily, so a bad zip/path surfaces here rather than up front.
                 last_error = str(exc)
                 print(f"failed UK input {input_path}: {exc}", file=sys.stderr)
-                continue
-            for doc_idx, (source, text) in enumerate(documents):
-                total += 1
-                code = ticker_list[input_idx] if input_idx < len(ticker_list) else input_path.stem.upper()
-                if code in cached_codes:
-                    continue
-                name = name_list[input_idx] if input_idx < len(name_list) else code
-                try:
-                    parsed = _parse_xbrl_xml(text)
-                    record = uk_facts_to_cache_record(code, name, source, parsed)
-                    out.write(json.dumps(record, ensure_ascii=False) + "\n")
-                    out.flush()
-                    cached_codes.add(code)
-                    written += 1
-                    print(f"[{written}] cached UK {code} from {source}")
-                    break
-                except Exception as exc:
-                    last_error = str(exc)
-                    print(f"failed UK document {source}: {exc}", file=sys.stderr)
     return written, total, last_error
 
 
@@ -3787,7 +4608,7 @@ def build_jp_fundamentals_cache(
     return written, len(targets), last_error
 
 
-@dataclass
+@dataclass(slots=True)
 class PriceSnapshot:
     name: str
     code: str
@@ -3800,10 +4621,23 @@ class PriceSnapshot:
     net_cash_per_share_ratio: Optional[str] = None
 
 
+_KIS_DEBT_KEY_TOKENS = ("lblt", "debt", "liab", "부채")
+_KIS_CASH_KEY_TOKENS = ("cash", "csh", "현금")
+
+
+@lru_cache(maxsize=1024)
+def _key_has_token(key: str, tokens: Tuple[str, ...]) -> bool:
+    """Case-insensitive token check for KIS response keys; schemas repeat, so results are memoized."""
+    lower = key.lower()
+    return any(token in lower for token in tokens)
+
+
 class KisClient:
     """Minimal client for Korea Investment OpenAPI to get price/PER/PBR and simple financials."""
 
     _shared_tokens: Dict[Tuple[str, str], Tuple[str, float]] = {}
+    _token_lock = threading.Lock()
+    _PRICE_PARAMS = {"FID_COND_MRKT_DIV_CODE": "J"}  # stock
 
     def __init__(
         self,
@@ -3814,9 +4648,11 @@ class KisClient:
         self.app_key = app_key
         self.app_secret = app_secret
         self.base_url = base_url.rstrip("/") if base_url else "https://openapivts.koreainvestment.com:29443"
-        self.session = requests.Session()
+        self.session = _HTTP_SESSION
         self._token: Optional[str] = None
         self._token_expiry: float = 0
+        self._base_headers = {"appkey": app_key, "appsecret": app_secret}
+        self._headers_by_tr_id: Dict[Tuple[str, str], Dict[str, str]] = {}
 
     def _token_url(self) -> str:
         # tokenP for paper trading; switch to token for production if needed.
@@ -3837,14 +4673,26 @@ class KisClient:
     def _balance_sheet_url(self) -> str:
         return f"{self.base_url}/uapi/domestic-stock/v1/finance/balance-sheet"
 
+    def _get(self, url: str, **kwargs) -> requests.Response:
+        _KIS_RATE_LIMITER.wait()
+        return self.session.get(url, timeout=10, **kwargs)
+
     def _ensure_token(self) -> str:
         now = time.time()
+        if self._token and now < self._token_expiry - 30:
+            return self._token
+        # Serialize refreshes so concurrent GUI/CLI callers don't double-POST tokenP.
+        with self._token_lock:
+            return self._refresh_token(time.time())
+
+    def _refresh_token(self, now: float) -> str:
         if self._token and now < self._token_expiry - 30:
             return self._token
         cache_key = (self.base_url, self.app_key)
-        cached = self._shared_tokens.get(cache_key)
+        cached = self._shared_tokens.get(cache_key) or self._read_disk_token()
         if cached and now < cached[1] - 30:
             self._token, self._token_expiry = cached
+            self._shared_tokens[cache_key] = cached
             return self._token
 
         payload = {
@@ -3852,11 +4700,12 @@ class KisClient:
             "appkey": self.app_key,
             "appsecret": self.app_secret,
         }
+        _KIS_RATE_LIMITER.wait()
         resp = self.session.post(self._token_url(), json=payload, timeout=10)
         if resp.status_code != 200:
             raise KisError(f"Token request failed: HTTP {resp.status_code} {resp.text}")
 
-        data = resp.json()
+        data = _json(resp)
         access_token = data.get("access_token")
         expires_in = data.get("expires_in", 0)
         if not access_token:
@@ -3865,28 +4714,82 @@ class KisClient:
         self._token = access_token
         self._token_expiry = now + int(expires_in or 0)
         self._shared_tokens[cache_key] = (self._token, self._token_expiry)
+        self._write_disk_token()
         return access_token
+
+    def _disk_token_path(self) -> Path:
+        # KIS allows one tokenP issue per minute, so new processes reuse the last token from disk.
+        digest = hashlib.sha256(f"{self.base_url}|{self.app_key}".encode("utf-8")).hexdigest()[:16]
+        return lookup_cache_dir() / f"kis_token_{digest}.json"
+
+    def _read_disk_token(self) -> Optional[Tuple[str, float]]:
+        try:
+            data = json.loads(self._disk_token_path().read_text(encoding="utf-8"))
+            return str(data["token"]), float(data["expiry"])
+        except Exception:
+            return None
+
+    def _write_disk_token(self) -> None:
+        """Best-effort, owner-only write of the current token; failures only cost a tokenP call."""
+        path = self._disk_token_path()
+        tmp_path = path.with_suffix(".tmp")
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            with os.fdopen(fd, "w", encoding="utf-8") as handle:
+                json.dump({"token": self._token, "expiry": self._token_expiry}, handle)
+            tmp_path.replace(path)
+        except Exception:
+            pass
 
     def _authorized_headers(self, tr_id: str) -> Dict[str, str]:
+        """Return request headers; the dict is reused per (tr_id, token), so callers must not mutate it."""
         token = self._ensure_token()
-        return {
-            "authorization": f"Bearer {token}",
-            "appkey": self.app_key,
-            "appsecret": self.app_secret,
-            "tr_id": tr_id,
-        }
+        cache_key = (tr_id, token)
+        headers = self._headers_by_tr_id.get(cache_key)
+        if headers is None:
+            if len(self._headers_by_tr_id) > 32:
+                self._headers_by_tr_id.clear()
+            headers = {**self._base_headers, "authorization": f"Bearer {token}", "tr_id": tr_id}
+            self._headers_by_tr_id[cache_key] = headers
+        return headers
+
+    def _authorized_get(self, url: str, tr_id: str, params: Dict[str, str]) -> requests.Response:
+        """GET with a bearer token, re-issuing it once if the server says a reused token has expired."""
+        headers = self._authorized_headers(tr_id)
+        resp = self._get(url, headers=headers, params=params)
+        if self._is_expired_token_response(resp):
+            self._invalidate_token(headers["authorization"][len("Bearer ") :])
+            resp = self._get(url, headers=self._authorized_headers(tr_id), params=params)
+        return resp
+
+    @staticmethod
+    def _is_expired_token_response(resp: requests.Response) -> bool:
+        # KIS reports an expired token as HTTP 500 with msg_cd EGW00123 rather than a plain 401.
+        return resp.status_code == 401 or (resp.status_code == 500 and "EGW00123" in resp.text)
+
+    def _invalidate_token(self, token: str) -> None:
+        """Forget a rejected token in memory and on disk, unless another caller already replaced it."""
+        with self._token_lock:
+            cache_key = (self.base_url, self.app_key)
+            if self._token == token:
+                self._token, self._token_expiry = None, 0
+            if (self._shared_tokens.get(cache_key) or (None,))[0] == token:
+                del self._shared_tokens[cache_key]
+            disk = self._read_disk_token()
+            if disk and disk[0] == token:
+                try:
+                    self._disk_token_path().unlink()
+                except OSError:
+                    pass
 
     def get_price_snapshot(self, stock_code: str) -> PriceSnapshot:
-        headers = self._authorized_headers("FHKST01010100")  # price lookup TR
-        params = {
-            "FID_COND_MRKT_DIV_CODE": "J",  # stock
-            "FID_INPUT_ISCD": stock_code,
-        }
-        resp = self.session.get(self._price_url(), headers=headers, params=params, timeout=10)
+        params = {**self._PRICE_PARAMS, "FID_INPUT_ISCD": stock_code}
+        resp = self._authorized_get(self._price_url(), "FHKST01010100", params)  # price lookup TR
         if resp.status_code != 200:
             raise KisError(f"Price request failed: HTTP {resp.status_code} {resp.text}")
 
-        data = resp.json()
+        data = _json(resp)
         output = data.get("output", {}) if isinstance(data, dict) else {}
         if not output:
             raise KisError(f"Unexpected price response payload: {data}")
@@ -3909,17 +4812,16 @@ class KisClient:
         )
 
     def get_overseas_stock_quote(self, exchange_code: str, symbol: str) -> Dict[str, Optional[float]]:
-        headers = self._authorized_headers("HHDFS00000300")
         params = {
             "AUTH": "",
             "EXCD": exchange_code,
             "SYMB": symbol,
         }
-        resp = self.session.get(self._overseas_price_url(), headers=headers, params=params, timeout=10)
+        resp = self._authorized_get(self._overseas_price_url(), "HHDFS00000300", params)
         if resp.status_code != 200:
             raise KisError(f"Overseas price request failed: HTTP {resp.status_code} {resp.text}")
 
-        data = resp.json()
+        data = _json(resp)
         output = data.get("output", {}) if isinstance(data, dict) else {}
         if not output:
             raise KisError(f"Unexpected overseas price response payload: {data}")
@@ -3937,17 +4839,16 @@ class KisClient:
         }
 
     def get_overseas_stock_quote_detail(self, exchange_code: str, symbol: str) -> Dict[str, Optional[float]]:
-        headers = self._authorized_headers("HHDFS76200200")
         params = {
             "AUTH": "",
             "EXCD": exchange_code,
             "SYMB": symbol,
         }
-        resp = self.session.get(self._overseas_price_detail_url(), headers=headers, params=params, timeout=10)
+        resp = self._authorized_get(self._overseas_price_detail_url(), "HHDFS76200200", params)
         if resp.status_code != 200:
             raise KisError(f"Overseas price-detail request failed: HTTP {resp.status_code} {resp.text}")
 
-        data = resp.json()
+        data = _json(resp)
         output = data.get("output", {}) if isinstance(data, dict) else {}
         if not output:
             raise KisError(f"Unexpected overseas price-detail response payload: {data}")
@@ -3976,9 +4877,10 @@ class KisClient:
 
     def get_financial_highlights(self, stock_code: str) -> Tuple[str, str]:
         """Return (cash, debt_ratio) for the latest period."""
-        cash_display = "N/A"
-        debt_display = "N/A"
+        return self._get_cash_display(stock_code), self._get_debt_ratio_display(stock_code)
 
+    def _get_debt_ratio_display(self, stock_code: str) -> str:
+        debt_display = "N/A"
         # Financial ratio for debt ratio.
         ratio_params = {
             "FID_DIV_CLS_CODE": "0",  # 0: year
@@ -3986,10 +4888,9 @@ class KisClient:
             "fid_input_iscd": stock_code,
         }
         try:
-            headers = self._authorized_headers("FHKST66430300")
-            resp = self.session.get(self._financial_ratio_url(), headers=headers, params=ratio_params, timeout=10)
+            resp = self._authorized_get(self._financial_ratio_url(), "FHKST66430300", ratio_params)
             if resp.status_code == 200:
-                payload = resp.json().get("output", {})
+                payload = _json(resp).get("output", {})
                 entry = self._first_in_output(payload)
                 debt_candidates = [
                     "lblt_rate",  # liabilities (debt) ratio
@@ -4002,7 +4903,10 @@ class KisClient:
                 debt_display = self._pick_number(entry, debt_candidates, default="N/A")
         except Exception:
             pass
+        return debt_display
 
+    def _get_cash_display(self, stock_code: str) -> str:
+        cash_display = "N/A"
         # Balance sheet for cash.
         bs_params = {
             "FID_DIV_CLS_CODE": "0",  # 0: year
@@ -4010,65 +4914,148 @@ class KisClient:
             "fid_input_iscd": stock_code,
         }
         try:
-            headers = self._authorized_headers("FHKST66430100")
-            resp = self.session.get(self._balance_sheet_url(), headers=headers, params=bs_params, timeout=10)
+            resp = self._authorized_get(self._balance_sheet_url(), "FHKST66430100", bs_params)
             if resp.status_code == 200:
-                payload = resp.json().get("output", {})
+                payload = _json(resp).get("output", {})
                 entry = self._first_in_output(payload)
                 cash_display = self._pick_cash(entry, default="N/A")
         except Exception:
             pass
-
-        return cash_display, debt_display
+        return cash_display
 
     def _pick_number(self, entry: Dict, candidates, default: str) -> str:
         for key in candidates:
-            if key in entry and entry[key] not in ("", None):
-                return clean_number(entry[key])
+            val = entry.get(key)
+            if val not in ("", None):
+                return clean_number(val)
         # fallback: only consider fields that clearly look like debt/liability ratios.
         for key, val in entry.items():
             if val in ("", None):
                 continue
-            lower = key.lower()
-            if any(token in lower for token in ("lblt", "debt", "liab", "부채")):
+            if _key_has_token(key, _KIS_DEBT_KEY_TOKENS):
                 return clean_number(val)
         return default
 
     def _pick_cash(self, entry: Dict, default: str) -> str:
         """Try to find a cash or cash-equivalent field in the balance sheet output."""
+        # One pass: a cash-like key wins; otherwise fall back to the first numeric-ish field.
+        fallback = None
         for key, val in entry.items():
             if val in ("", None):
                 continue
-            lower = key.lower()
-            if any(token in lower for token in ("cash", "csh", "현금")):
-                return clean_number(val)
-        # fallback: pick first numeric-ish field if it looks like a large asset number
-        for key, val in entry.items():
-            if val in ("", None):
-                continue
-            if isinstance(val, (int, float)):
+            if _key_has_token(key, _KIS_CASH_KEY_TOKENS):
                 return clean_number(val)
-            if isinstance(val, str):
-                digits = "".join(ch for ch in val if ch.isdigit() or ch == ".")
-                if digits:
-                    return clean_number(val)
-        return default
+            if fallback is None and (
+                isinstance(val, (int, float)) or (isinstance(val, str) and _DIGIT_OR_DOT_RE.search(val))
+            ):
+                fallback = val
+        return clean_number(fallback) if fallback is not None else default
 
     def get_snapshot_with_financials(self, stock_code: str) -> PriceSnapshot:
-        snapshot = self.get_price_snapshot(stock_code)
-        cash, debt_ratio = self.get_financial_highlights(stock_code)
+        # Warm the token first so the three concurrent requests don't race to refresh it.
+        self._ensure_token()
+        # The price request runs on this thread while the two financial lookups are in flight.
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            cash_future = executor.submit(self._get_cash_display, stock_code)
+            debt_future = executor.submit(self._get_debt_ratio_display, stock_code)
+            snapshot = self.get_price_snapshot(stock_code)
+            cash = cash_future.result()
+            debt_ratio = debt_future.result()
         snapshot.cash = cash
         snapshot.debt_ratio = debt_ratio
         return snapshot
 
 
+_KIS_CLIENTS: Dict[Tuple[str, str, Optional[str]], KisClient] = {}
+_KIS_CLIENTS_LOCK = threading.Lock()
+
+
+def get_kis_client(app_key: str, app_secret: str, base_url: Optional[str] = None) -> KisClient:
+    """Return a process-wide KisClient per credential set so its session and token are reused."""
+    cache_key = (app_key, app_secret, base_url)
+    with _KIS_CLIENTS_LOCK:
+        client = _KIS_CLIENTS.get(cache_key)
+        if client is None:
+            client = KisClient(app_key, app_secret, base_url=base_url)
+            _KIS_CLIENTS[cache_key] = client
+        return client
+
+
+# Repeat GUI lookups inside these windows reuse the previous KIS/DART result.
+KIS_SNAPSHOT_CACHE_SECONDS = 60
+DART_FINANCIALS_CACHE_SECONDS = 10 * 60
+# Live Range Scan rows per ticker, so re-scanning with tweaked filters skips the network.
+SCAN_RESULTS_CACHE_SECONDS = 10 * 60
+_LOOKUP_RESULTS: Dict[Tuple[Any, ...], Tuple[float, Any]] = {}
+_SCAN_RESULTS: Dict[Tuple[Any, ...], Tuple[float, Any]] = {}
+_LOOKUP_RESULTS_LOCK = threading.Lock()
+
+
+def cached_lookup(
+    key: Tuple[Any, ...],
+    max_age_seconds: float,
+    fetch: Callable[[], Any],
+    force: bool = False,
+    results: Optional[Dict[Tuple[Any, ...], Tuple[float, Any]]] = None,
+    max_entries: int = 256,
+) -> Any:
+    """Return fetch() memoized in-process for max_age_seconds; force skips the cached value and refreshes it.
+
+    results selects the store (default: the GUI lookup results); it is emptied once it reaches max_entries.
+    Cached values are shared, so callers must not mutate them (use dataclasses.replace for snapshots).
+    """
+    store = _LOOKUP_RESULTS if results is None else results
+    if not force:
+        with _LOOKUP_RESULTS_LOCK:
+            hit = store.get(key)
+        if hit is not None and time.monotonic() - hit[0] < max_age_seconds:
+            return hit[1]
+    value = fetch()
+    with _LOOKUP_RESULTS_LOCK:
+        if len(store) >= max_entries:
+            store.clear()
+        store[key] = (time.monotonic(), value)
+    return value
+
+
+@dataclass(frozen=True, slots=True)
+class KisConfig:
+    app_key: Optional[str]
+    app_secret: Optional[str]
+    base_url: Optional[str]
+
+    @property
+    def configured(self) -> bool:
+        return bool(self.app_key and self.app_secret)
+
+
+@lru_cache(maxsize=1)
+def kis_config() -> KisConfig:
+    """KIS_* settings read once per process (after .env is loaded); call kis_config.cache_clear() to re-read."""
+    return KisConfig(
+        app_key=os.getenv("KIS_APP_KEY"),
+        app_secret=os.getenv("KIS_APP_SECRET"),
+        base_url=os.getenv("KIS_BASE_URL"),
+    )
+
+
+def kis_client_from_env(required: bool = True) -> Optional[KisClient]:
+    """Return the shared KisClient for the KIS_* environment keys.
+
+    Raises KisError when the keys are missing, or returns None if required is False.
+    """
+    if not required and not kis_quote_configured():
+        return None
+    app_key, app_secret, base_url = load_keys()
+    return get_kis_client(app_key, app_secret, base_url=base_url)
+
+
 def kis_quote_configured() -> bool:
-    return bool(os.getenv("KIS_APP_KEY") and os.getenv("KIS_APP_SECRET"))
+    return kis_config().configured
 
 
 def fetch_kis_quotes_batch(tickers: List[str]) -> Dict[str, Dict[str, Optional[float]]]:
-    app_key, app_secret, base_url = load_keys()
-    client = KisClient(app_key, app_secret, base_url=base_url)
+    client = kis_client_from_env()
     quotes: Dict[str, Dict[str, Optional[float]]] = {}
     seen_codes = set()
     last_error = None
@@ -4114,8 +5101,7 @@ def fetch_kis_jp_quotes_batch(
     *,
     progress_cb: Optional[Callable[[str], None]] = None,
 ) -> Dict[str, Dict[str, Optional[float]]]:
-    app_key, app_secret, base_url = load_keys()
-    client = KisClient(app_key, app_secret, base_url=base_url)
+    client = kis_client_from_env()
     quotes: Dict[str, Dict[str, Optional[float]]] = {}
     seen_codes = set()
     last_error = None
@@ -4147,11 +5133,7 @@ def extract_edgar_scan_fundamentals(facts: Dict) -> Dict[str, Any]:
     """Extract EDGAR fundamentals needed for US range scanning (no quote-dependent metrics)."""
 
     def pick_fact(tags) -> Optional[int]:
-        for tag in tags:
-            val = _extract_latest_fact(facts, tag)
-            if val is not None:
-                return _parse_int(val)
-        return None
+        return _pick_latest_fact(facts, tags)[0]
 
     cash_val = pick_fact(("CashAndCashEquivalentsAtCarryingValue",))
     current_marketable = pick_fact(("MarketableSecuritiesCurrent", "ShortTermInvestments"))
@@ -4418,7 +5400,7 @@ def build_kr_fundamentals_cache(
     cached_codes = set() if force else load_cached_codes(output_path)
     try:
         _, stock_map, code_to_name = load_dart_corp_map()
-        krx_codes = set(load_name_map().values())
+        krx_codes = krx_listed_codes()
     except Exception as exc:
         last_error = str(exc)
         if is_dart_usage_limit_error(exc):
@@ -4459,20 +5441,30 @@ def build_kr_fundamentals_cache(
     return written, len(targets), last_error
 
 
+# Quote and USD/KRW side fetches for EDGAR lookups, shared so concurrent Range Scan workers don't
+# each start their own threads.
+_EDGAR_SIDE_EXECUTOR = ThreadPoolExecutor(max_workers=SCAN_WORKERS, thread_name_prefix="edgar-side")
+
+
 def fetch_edgar_financials(user_text: str) -> Tuple[PriceSnapshot, Dict[str, str]]:
     company = resolve_edgar_company(user_text)
     ticker = company.get("ticker") or user_text
     cik = company.get("cik") or ""
     name = company.get("name") or ticker
 
-    facts = load_company_facts(cik)
+    # The quote and FX rate don't depend on companyfacts; fetch them while the facts load.
+    quote_future = _EDGAR_SIDE_EXECUTOR.submit(fetch_yahoo_quote, ticker)
+    usdkrw_future = _EDGAR_SIDE_EXECUTOR.submit(fetch_usdkrw_rate)
+    try:
+        facts = load_company_facts(cik)
+    except BaseException:
+        # Without companyfacts there is nothing to price; drop side fetches that haven't started.
+        quote_future.cancel()
+        usdkrw_future.cancel()
+        raise
 
     def pick_fact(tags):
-        for tag in tags:
-            val = _extract_latest_fact(facts, tag)
-            if val is not None:
-                return _parse_int(val), tag
-        return None, None
+        return _pick_latest_fact(facts, tags)
 
     cash_val, cash_tag = pick_fact(("CashAndCashEquivalentsAtCarryingValue",))
     current_marketable, current_marketable_tag = pick_fact(
@@ -4588,12 +5580,12 @@ def fetch_edgar_financials(user_text: str) -> Tuple[PriceSnapshot, Dict[str, str
         net_income_growth_5y = build_yoy_average_text(net_income_growth_5y_avg_pct, net_count, net_transitions)
     except Exception:
         pass
-    usdkrw_rate = fetch_usdkrw_rate()
+    usdkrw_rate = usdkrw_future.result()
 
     quote = {}
     quote_error = None
     try:
-        quote = fetch_yahoo_quote(ticker)
+        quote = quote_future.result()
     except Exception as exc:
         quote_error = str(exc)
         quote = {}
@@ -4720,7 +5712,7 @@ def resolve_code(user_text: str) -> Optional[str]:
     if not user_text:
         return None
     trimmed = user_text.strip()
-    digits = "".join(ch for ch in trimmed if ch.isdigit())
+    digits = _NON_DIGITS_RE.sub("", trimmed)
     if len(digits) >= 6:
         return digits[:6]
 
@@ -4728,12 +5720,10 @@ def resolve_code(user_text: str) -> Optional[str]:
 
 
 def load_keys() -> Tuple[str, str, Optional[str]]:
-    app_key = os.getenv("KIS_APP_KEY")
-    app_secret = os.getenv("KIS_APP_SECRET")
-    base_url = os.getenv("KIS_BASE_URL")
-    if not app_key or not app_secret:
+    config = kis_config()
+    if not config.configured:
         raise KisError("Set KIS_APP_KEY and KIS_APP_SECRET in your environment or .env file.")
-    return app_key, app_secret, base_url
+    return config.app_key, config.app_secret, config.base_url
 
 
 def run_cli(symbol: Optional[str]) -> int:
@@ -4751,8 +5741,7 @@ def run_cli(symbol: Optional[str]) -> int:
         return 1
 
     try:
-        app_key, app_secret, base_url = load_keys()
-        client = KisClient(app_key, app_secret, base_url=base_url)
+        client = kis_client_from_env()
         snapshot = client.get_snapshot_with_financials(code)
     except Exception as exc:  # broad catch for a simple CLI
         print(f"Lookup failed: {exc}", file=sys.stderr)
@@ -4776,11 +5765,8 @@ def run_dart_cli(symbol: Optional[str], year: Optional[str]) -> int:
     # Try KIS to get 상장주식수 for fallback when DART 유통주식수 is missing.
     try:
         stock_code = resolve_code(user_input)
-        app_key = os.getenv("KIS_APP_KEY")
-        app_secret = os.getenv("KIS_APP_SECRET")
-        base_url = os.getenv("KIS_BASE_URL")
-        if stock_code and app_key and app_secret:
-            kis_client = KisClient(app_key, app_secret, base_url=base_url)
+        kis_client = kis_client_from_env(required=False)
+        if stock_code and kis_client:
             price_snapshot = kis_client.get_price_snapshot(stock_code)
             fallback_listed_shares = price_snapshot.listed_shares
             market_price = parse_amount(price_snapshot.price)
@@ -4841,6 +5827,8 @@ def gui_supported() -> Tuple[bool, Optional[str]]:
     if sys.platform != "darwin":
         return True, None
 
+    import platform  # deferred: only consulted on macOS
+
     release = platform.mac_ver()[0] or ""
     parts = release.split(".")
     try:
@@ -4872,6 +5860,7 @@ def build_gui():
 
     country_var = tk.StringVar(value="US")
     input_var = tk.StringVar()
+    force_refresh_var = tk.BooleanVar(value=False)
     status_var = tk.StringVar(
         value="Select a country, then enter a company. KR uses KIS/DART; US uses EDGAR; JP/UK Range Scan use official caches."
     )
@@ -4893,6 +5882,78 @@ def build_gui():
     dart_net_income_growth_var = tk.StringVar(value="-")
     dart_equity_var = tk.StringVar(value="-")
 
+    # Worker threads never call into Tcl themselves: they queue callables that the Tk thread
+    # drains on a short after() pump.
+    ui_calls: "queue.SimpleQueue[Tuple[Callable[..., Any], Tuple[Any, ...]]]" = queue.SimpleQueue()
+
+    def call_on_ui(func: Callable[..., Any], *args: Any) -> None:
+        ui_calls.put((func, args))
+
+    def pump_ui_calls():
+        while True:
+            try:
+                func, args = ui_calls.get_nowait()
+            except queue.Empty:
+                break
+            try:
+                func(*args)
+            except Exception:
+                pass
+        root.after(20, pump_ui_calls)
+
+    root.after(20, pump_ui_calls)
+
+    def coalescing_setter(var: tk.StringVar, delay_ms: int = 50) -> Callable[[str], None]:
+        """Thread-safe setter for status labels: only the latest text within delay_ms reaches Tk."""
+        pending: Dict[str, Any] = {"text": "", "scheduled": False}
+        lock = threading.Lock()
+
+        def flush():
+            with lock:
+                text = pending["text"]
+                pending["scheduled"] = False
+            var.set(text)
+
+        def set_text(text: str):
+            with lock:
+                pending["text"] = text
+                if pending["scheduled"]:
+                    return
+                pending["scheduled"] = True
+            call_on_ui(root.after, delay_ms, flush)
+
+        return set_text
+
+    def batching_row_inserter(tree, delay_ms: int = 200, max_rows: int = 500) -> Callable[[Tuple[Any, ...]], None]:
+        """Thread-safe Treeview appender: rows are buffered and inserted in chunks every delay_ms."""
+        pending: Dict[str, Any] = {"rows": [], "scheduled": False}
+        lock = threading.Lock()
+
+        def flush():
+            with lock:
+                batch = pending["rows"][:max_rows]
+                del pending["rows"][:max_rows]
+                more = bool(pending["rows"])
+                pending["scheduled"] = more
+            for values in batch:
+                try:
+                    tree.insert("", "end", values=values)
+                except Exception:
+                    pass
+            if more:
+                # Yield to the event loop between chunks so a large result set doesn't freeze the window.
+                root.after(1, flush)
+
+        def add_row(values: Tuple[Any, ...]):
+            with lock:
+                pending["rows"].append(values)
+                if pending["scheduled"]:
+                    return
+                pending["scheduled"] = True
+            call_on_ui(root.after, delay_ms, flush)
+
+        return add_row
+
     def open_scan_modal():
         selected_country = country_var.get()
         modal = tk.Toplevel(root)
@@ -5091,7 +6152,7 @@ def build_gui():
             def worker():
                 try:
                     set_text = f"Fetching official detail ({row_country} {row_code})..."
-                    root.after(0, lambda: scan_status_var.set(set_text))
+                    call_on_ui(scan_status_var.set, set_text)
                     if row_country == "US":
                         snapshot, detail = fetch_edgar_financials(row_code)
                     elif row_country == "JP":
@@ -5100,8 +6161,7 @@ def build_gui():
                         code = resolve_code(row_code)
                         if not code:
                             raise KisError("Could not resolve KR stock code.")
-                        app_key, app_secret, base_url = load_keys()
-                        kis_client = KisClient(app_key, app_secret, base_url=base_url)
+                        kis_client = kis_client_from_env()
                         snapshot = kis_client.get_snapshot_with_financials(code)
                         price_val = parse_amount(snapshot.price)
                         detail = fetch_dart_financials(
@@ -5124,11 +6184,18 @@ def build_gui():
                         "N/A",
                         "N/A",
                     )
-                    root.after(0, lambda: (tree.item(item_id, values=updated), scan_status_var.set(f"Official detail updated: {row_country} {row_code}")))
+                    call_on_ui(lambda: (tree.item(item_id, values=updated), scan_status_var.set(f"Official detail updated: {row_country} {row_code}")))
                 except Exception as exc:
-                    root.after(0, lambda: messagebox.showerror("Official Detail failed", str(exc)))
+                    call_on_ui(messagebox.showerror, "Official Detail failed", str(exc))
+                finally:
+                    details_in_flight.discard(detail_key)
 
-            threading.Thread(target=worker, daemon=True).start()
+            detail_key = (row_country, row_code)
+            if detail_key in details_in_flight:
+                scan_status_var.set(f"Already fetching official detail ({row_country} {row_code})...")
+                return
+            details_in_flight.add(detail_key)
+            background_jobs.put(worker)
 
         def selected_scan_countries() -> List[str]:
             return [country for country in COUNTRY_CHOICES if country_checks[country].get()]
@@ -5165,16 +6232,14 @@ def build_gui():
                     return False
                 return delta_val >= delta_min
 
+            force_scan = force_refresh_var.get()
             for item in tree.get_children():
                 tree.delete(item)
             scan_status_var.set("Preparing scan...")
 
             def worker():
-                def set_scan_status(text: str):
-                    try:
-                        root.after(0, lambda: scan_status_var.set(text))
-                    except Exception:
-                        pass
+                set_scan_status = coalescing_setter(scan_status_var)
+                insert_row = batching_row_inserter(tree)
 
                 try:
                     countries = selected_scan_countries()
@@ -5215,7 +6280,7 @@ def build_gui():
                                 last_error = cache_error
                             for row_values in rows:
                                 matched_total += 1
-                                root.after(0, lambda vals=row_values: tree.insert("", "end", values=vals))
+                                insert_row(row_values)
                             set_scan_status(f"{scan_country} cache scanning done: {len(rows)}/{total} matched")
                             processed_total += total
                             continue
@@ -5228,69 +6293,99 @@ def build_gui():
                         total = len(targets)
                         matched = 0
                         set_scan_status(f"Official scanning {scan_country}... 0/{total}")
-                        for processed, target in enumerate(targets, start=1):
+
+                        def fetch_target(target, scan_country):
+                            """Return (snapshot, detail, None), or (None, None, error) for tickers the sources lack."""
                             try:
                                 if scan_country == "US":
                                     snapshot, detail = fetch_edgar_financials(target.get("ticker", ""))
-                                else:
-                                    code = target.get("ticker", "")
-                                    app_key, app_secret, base_url = load_keys()
-                                    kis_client = KisClient(app_key, app_secret, base_url=base_url)
-                                    snapshot = kis_client.get_snapshot_with_financials(code)
-                                    price_val = parse_amount(snapshot.price)
-                                    detail = fetch_dart_financials(
-                                        code,
-                                        fallback_listed_shares=snapshot.listed_shares,
-                                        market_price=price_val,
-                                    )
-                                    if detail.get("corp_name"):
-                                        snapshot.name = detail.get("corp_name")
+                                    return snapshot, detail, None
+                                code = target.get("ticker", "")
+                                kis_client = kis_client_from_env()
+                                snapshot = kis_client.get_snapshot_with_financials(code)
+                                price_val = parse_amount(snapshot.price)
+                                detail = fetch_dart_financials(
+                                    code,
+                                    fallback_listed_shares=snapshot.listed_shares,
+                                    market_price=price_val,
+                                )
+                                if detail.get("corp_name"):
+                                    snapshot.name = detail.get("corp_name")
+                                return snapshot, detail, None
+                            except (DartError, EdgarError) as exc:
+                                # Missing filings don't appear within minutes; cache the miss too.
+                                if is_dart_usage_limit_error(exc):
+                                    raise
+                                return None, None, str(exc)
+
+                        def scan_target(target, scan_country=scan_country):
+                            """Fetch one ticker and return its result row, or None when it misses the filters."""
+                            snapshot, detail, error = cached_lookup(
+                                ("scan", scan_country, target.get("ticker", "")),
+                                SCAN_RESULTS_CACHE_SECONDS,
+                                lambda: fetch_target(target, scan_country),
+                                force=force_scan,
+                                results=_SCAN_RESULTS,
+                                max_entries=20000,
+                            )
+                            if error:
+                                raise OfficialDataError(error)
 
-                                per_val = parse_float(snapshot.per)
-                                pbr_val = parse_float(snapshot.pbr)
-                                debt_val = parse_float(snapshot.debt_ratio)
-                                if scan_country == "US":
-                                    debt_val = detail.get("liabilities_ratio_value")
-                                ib_de_ratio_val = detail.get("interest_bearing_debt_ratio_value")
-                                ncs_ratio_val = parse_float(detail.get("net_cash_per_share_ratio"))
-                                sales_growth_pct = detail.get("sales_growth_5y_avg_pct")
-                                op_growth_pct = detail.get("op_growth_5y_avg_pct")
-                                net_growth_pct = detail.get("net_income_growth_5y_avg_pct")
-                                delta_sales_val = sales_growth_pct - per_val if sales_growth_pct is not None and per_val else None
-                                delta_op_val = op_growth_pct - per_val if op_growth_pct is not None and per_val else None
-                                delta_net_val = net_growth_pct - per_val if net_growth_pct is not None and per_val else None
+                            per_val = parse_float(snapshot.per)
+                            pbr_val = parse_float(snapshot.pbr)
+                            debt_val = parse_float(snapshot.debt_ratio)
+                            if scan_country == "US":
+                                debt_val = detail.get("liabilities_ratio_value")
+                            ib_de_ratio_val = detail.get("interest_bearing_debt_ratio_value")
+                            ncs_ratio_val = parse_float(detail.get("net_cash_per_share_ratio"))
+                            sales_growth_pct = detail.get("sales_growth_5y_avg_pct")
+                            op_growth_pct = detail.get("op_growth_5y_avg_pct")
+                            net_growth_pct = detail.get("net_income_growth_5y_avg_pct")
+                            delta_sales_val = sales_growth_pct - per_val if sales_growth_pct is not None and per_val else None
+                            delta_op_val = op_growth_pct - per_val if op_growth_pct is not None and per_val else None
+                            delta_net_val = net_growth_pct - per_val if net_growth_pct is not None and per_val else None
 
-                                if not (
-                                    in_range(per_val, per_min, per_max)
-                                    and in_range(pbr_val, pbr_min, pbr_max)
-                                    and in_range(debt_val, debt_min, debt_max)
-                                    and in_range(ncs_ratio_val, ncsr_min, ncsr_max)
-                                    and in_range(ib_de_ratio_val, ib_debt_min, ib_debt_max)
-                                    and delta_passes(sales_delta_min, sales_growth_pct, per_val)
-                                    and delta_passes(op_delta_min, op_growth_pct, per_val)
-                                    and delta_passes(net_delta_min, net_growth_pct, per_val)
-                                ):
-                                    continue
+                            if not (
+                                in_range(per_val, per_min, per_max)
+                                and in_range(pbr_val, pbr_min, pbr_max)
+                                and in_range(debt_val, debt_min, debt_max)
+                                and in_range(ncs_ratio_val, ncsr_min, ncsr_max)
+                                and in_range(ib_de_ratio_val, ib_debt_min, ib_debt_max)
+                                and delta_passes(sales_delta_min, sales_growth_pct, per_val)
+                                and delta_passes(op_delta_min, op_growth_pct, per_val)
+                                and delta_passes(net_delta_min, net_growth_pct, per_val)
+                            ):
+                                return None
 
-                                matched += 1
-                                matched_total += 1
-                                values = (
-                                    scan_country,
-                                    snapshot.name,
-                                    target.get("ticker") or snapshot.code,
-                                    snapshot.per,
-                                    snapshot.pbr,
-                                    f"{debt_val:,.2f}" if debt_val is not None else "N/A",
-                                    detail.get("net_cash_per_share_ratio", "N/A"),
-                                    f"{delta_sales_val:,.2f}" if delta_sales_val is not None else "N/A",
-                                    f"{delta_op_val:,.2f}" if delta_op_val is not None else "N/A",
-                                    f"{delta_net_val:,.2f}" if delta_net_val is not None else "N/A",
-                                )
-                                root.after(0, lambda vals=values: tree.insert("", "end", values=vals))
-                            except Exception as exc:
-                                last_error = str(exc)
-                            if processed % 10 == 0 or processed == total:
-                                set_scan_status(f"Official scanning {scan_country}... {processed}/{total}, matched {matched}")
+                            return (
+                                scan_country,
+                                snapshot.name,
+                                target.get("ticker") or snapshot.code,
+                                snapshot.per,
+                                snapshot.pbr,
+                                f"{debt_val:,.2f}" if debt_val is not None else "N/A",
+                                detail.get("net_cash_per_share_ratio", "N/A"),
+                                f"{delta_sales_val:,.2f}" if delta_sales_val is not None else "N/A",
+                                f"{delta_op_val:,.2f}" if delta_op_val is not None else "N/A",
+                                f"{delta_net_val:,.2f}" if delta_net_val is not None else "N/A",
+                            )
+
+                        # Tickers are network-bound, so overlap them; the DART/KIS rate limiters
+                        # still cap the request rate. Rows appear in completion order.
+                        with ThreadPoolExecutor(max_workers=SCAN_WORKERS) as scan_executor:
+                            futures = [scan_executor.submit(scan_target, target) for target in targets]
+                            for processed, future in enumerate(as_completed(futures), start=1):
+                                try:
+                                    values = future.result()
+                                except Exception as exc:
+                                    last_error = str(exc)
+                                    values = None
+                                if values is not None:
+                                    matched += 1
+                                    matched_total += 1
+                                    insert_row(values)
+                                if processed % 10 == 0 or processed == total:
+                                    set_scan_status(f"Official scanning {scan_country}... {processed}/{total}, matched {matched}")
                         processed_total += total
 
                     if last_error:
@@ -5468,7 +6563,7 @@ def build_gui():
                                         delta_op_text,
                                         delta_net_text,
                                     )
-                                    root.after(0, lambda vals=values: tree.insert("", "end", values=vals))
+                                    insert_row(values)
                                 except Exception as exc:
                                     last_error = str(exc)
 
@@ -5490,7 +6585,7 @@ def build_gui():
                         raw_tickers = os.getenv(market["scan_env"], "")
                         tickers = [
                             t.strip()
-                            for t in re.split(r"[\s,;]+", raw_tickers)
+                            for t in _LIST_SEPARATORS_RE.split(raw_tickers)
                             if t.strip()
                         ]
                         if not tickers and selected_country == "JP" and jquants_configured():
@@ -5547,7 +6642,7 @@ def build_gui():
                                     f"{delta_op_val:,.2f}" if delta_op_val is not None else "N/A",
                                     f"{delta_net_val:,.2f}" if delta_net_val is not None else "N/A",
                                 )
-                                root.after(0, lambda vals=values: tree.insert("", "end", values=vals))
+                                insert_row(values)
                             except Exception as exc:
                                 last_error = str(exc)
                             if processed % 10 == 0 or processed == total:
@@ -5559,17 +6654,14 @@ def build_gui():
                             set_scan_status(f"완료: {matched}개 매치 / {total}개 처리")
                         return
 
-                    app_key = os.getenv("KIS_APP_KEY")
-                    app_secret = os.getenv("KIS_APP_SECRET")
-                    base_url = os.getenv("KIS_BASE_URL")
-                    if not app_key or not app_secret:
+                    kis_client = kis_client_from_env(required=False)
+                    if kis_client is None:
                         set_scan_status("KIS 키를 설정하세요.")
                         return
 
                     set_scan_status("KRX/DART 목록 불러오는 중...")
-                    kis_client = KisClient(app_key, app_secret, base_url=base_url)
                     _, stock_map, code_to_name = load_dart_corp_map()
-                    krx_codes = set(load_name_map().values())
+                    krx_codes = krx_listed_codes()
                     targets = [(code, corp_code) for code, corp_code in stock_map.items() if code in krx_codes]
                     if not targets:
                         set_scan_status("대상 종목이 없습니다 (KRX 필터 이후 비어 있음)")
@@ -5640,7 +6732,7 @@ def build_gui():
                                 delta_op_text,
                                 delta_net_text,
                             )
-                            root.after(0, lambda vals=values: tree.insert("", "end", values=vals))
+                            insert_row(values)
                         except Exception as exc:
                             last_error = str(exc)
                         if processed % 10 == 0 or processed == total:
@@ -5653,13 +6745,25 @@ def build_gui():
                 except Exception as exc:
                     set_scan_status(f"오류: {exc}")
 
-            threading.Thread(target=worker, daemon=True).start()
+            background_jobs.put(worker)
 
-    def set_status(text: str):
-        try:
-            root.after(0, lambda: status_var.set(text))
-        except Exception:
-            pass
+    set_status = coalescing_setter(status_var)
+
+    # Last value pushed to each result StringVar (by Tcl name), so unchanged fields skip the Tcl set.
+    shown_values: Dict[str, Any] = {}
+    _UNSET = object()
+
+    def apply_result_updates(updates: List[Tuple[tk.StringVar, Any]]):
+        # One Tk callback per refresh; a failing set() no longer drops the remaining fields.
+        for var, value in updates:
+            name = str(var)
+            if shown_values.get(name, _UNSET) == value:
+                continue
+            try:
+                var.set(value)
+                shown_values[name] = value
+            except Exception:
+                pass
 
     def update_view(snapshot: PriceSnapshot, dart_data=None):
         debt_display = snapshot.debt_ratio
@@ -5671,55 +6775,93 @@ def build_gui():
                     ib_ratio_display = f"{ib_ratio}%"
         except Exception:
             ib_ratio_display = "-"
-        try:
-            root.after(
-                0,
-                lambda: (
-                    name_var.set(snapshot.name),
-                    price_var.set(snapshot.price),
-                    per_var.set(snapshot.per),
-                    pbr_var.set(snapshot.pbr),
-                    debt_var.set(debt_display),
-                    ib_debt_var.set(ib_ratio_display),
-                ),
-            )
-        except Exception:
-            return
+        updates = [
+            (name_var, snapshot.name),
+            (price_var, snapshot.price),
+            (per_var, snapshot.per),
+            (pbr_var, snapshot.pbr),
+            (debt_var, debt_display),
+            (ib_debt_var, ib_ratio_display),
+        ]
+        dart_vars = (
+            dart_year_var,
+            dart_net_cash_ps_var,
+            dart_net_cash_ps_ratio_var,
+            dart_sales_var,
+            dart_op_var,
+            dart_sales_growth_var,
+            dart_op_growth_var,
+            dart_net_income_growth_var,
+            dart_equity_var,
+        )
         try:
             if dart_data:
                 summary = dart_data.get("summary", {}) if isinstance(dart_data, dict) else {}
-                root.after(
-                    0,
-                    lambda: (
-                        dart_year_var.set(dart_data.get("bsns_year", "-")),
-                        dart_net_cash_ps_var.set(dart_data.get("net_cash_per_share", "N/A")),
-                        dart_net_cash_ps_ratio_var.set(dart_data.get("net_cash_per_share_ratio", "N/A")),
-                        dart_sales_var.set(summary.get("매출액", "N/A")),
-                        dart_op_var.set(summary.get("영업이익", "N/A")),
-                        dart_sales_growth_var.set(dart_data.get("sales_growth_5y", "N/A")),
-                        dart_op_growth_var.set(dart_data.get("op_growth_5y", "N/A")),
-                        dart_net_income_growth_var.set(dart_data.get("net_income_growth_5y", "N/A")),
-                        dart_equity_var.set(summary.get("자본총계", "N/A")),
-                    ),
+                dart_values = (
+                    dart_data.get("bsns_year", "-"),
+                    dart_data.get("net_cash_per_share", "N/A"),
+                    dart_data.get("net_cash_per_share_ratio", "N/A"),
+                    summary.get("매출액", "N/A"),
+                    summary.get("영업이익", "N/A"),
+                    dart_data.get("sales_growth_5y", "N/A"),
+                    dart_data.get("op_growth_5y", "N/A"),
+                    dart_data.get("net_income_growth_5y", "N/A"),
+                    summary.get("자본총계", "N/A"),
                 )
             else:
-                root.after(
-                    0,
-                    lambda: (
-                        dart_year_var.set("-"),
-                        dart_net_cash_ps_var.set("-"),
-                        dart_net_cash_ps_ratio_var.set("-"),
-                        dart_sales_var.set("-"),
-                        dart_op_var.set("-"),
-                        dart_sales_growth_var.set("-"),
-                        dart_op_growth_var.set("-"),
-                        dart_net_income_growth_var.set("-"),
-                        dart_equity_var.set("-"),
-                    ),
-                )
+                dart_values = ("-",) * len(dart_vars)
+            updates.extend(zip(dart_vars, dart_values))
+        except Exception:
+            pass
+
+        try:
+            call_on_ui(apply_result_updates, updates)
         except Exception:
             pass
 
+    # One long-lived lookup thread; the queue holds at most one pending job so rapid
+    # clicks replace each other instead of piling up parallel fetches.
+    fetch_jobs: "queue.Queue[Optional[Callable[[], None]]]" = queue.Queue(maxsize=1)
+
+    def fetch_loop():
+        while True:
+            job = fetch_jobs.get()
+            if job is None:
+                return
+            try:
+                job()
+            except Exception as exc:
+                set_status(f"오류: {exc}")
+
+    def submit_fetch(job: Optional[Callable[[], None]]):
+        while True:
+            try:
+                fetch_jobs.put_nowait(job)
+                return
+            except queue.Full:
+                try:
+                    fetch_jobs.get_nowait()
+                except queue.Empty:
+                    pass
+
+    threading.Thread(target=fetch_loop, daemon=True).start()
+
+    # Range Scan and Official Detail jobs share two long-lived workers. They are daemon threads
+    # so a running scan never keeps the process alive after the window closes.
+    background_jobs: "queue.Queue[Callable[[], None]]" = queue.Queue()
+    details_in_flight: Set[Tuple[str, str]] = set()
+
+    def background_loop():
+        while True:
+            job = background_jobs.get()
+            try:
+                job()
+            except Exception:
+                pass
+
+    for _ in range(2):
+        threading.Thread(target=background_loop, daemon=True).start()
+
     def do_fetch():
         user_input = input_var.get().strip()
         selected_country = country_var.get()
@@ -5739,38 +6881,55 @@ def build_gui():
                 messagebox.showerror("Input error", "Enter a valid company name or 6-digit code.")
                 return
 
-            app_key = os.getenv("KIS_APP_KEY")
-            app_secret = os.getenv("KIS_APP_SECRET")
-            base_url = os.getenv("KIS_BASE_URL")
-            kis_enabled = bool(app_key and app_secret)
-            client = KisClient(app_key, app_secret, base_url=base_url) if kis_enabled else None
+            client = kis_client_from_env(required=False)
+            force = force_refresh_var.get()
 
             def worker():
                 set_status("Fetching (KR)...")
                 dart_data = None
                 dart_error = None
                 snapshot = PriceSnapshot(name="N/A", code=code, price="N/A", per="N/A", pbr="N/A")
-                try:
-                    if kis_enabled and client:
-                        snapshot = client.get_snapshot_with_financials(code)
-                except Exception as exc:  # broad catch to show UI errors
-                    set_status("KIS 실패, DART만 표시")
-                    snapshot = PriceSnapshot(name="N/A", code=code, price="N/A", per="N/A", pbr="N/A")
-
-                market_price = parse_amount(snapshot.price)
+                # KIS and DART are independent requests: run them side by side and merge the
+                # KIS listed shares/price into the DART per-share figures afterwards.
+                with ThreadPoolExecutor(max_workers=1) as executor:
+                    kis_future = None
+                    if client is not None:
+                        kis_future = executor.submit(
+                            cached_lookup,
+                            ("kis_snapshot", client.base_url, client.app_key, code),
+                            KIS_SNAPSHOT_CACHE_SECONDS,
+                            lambda: client.get_snapshot_with_financials(code),
+                            force,
+                        )
+                    try:
+                        dart_data = cached_lookup(
+                            ("dart_financials", normalize_name(user_input)),
+                            DART_FINANCIALS_CACHE_SECONDS,
+                            lambda: fetch_dart_financials(user_input),
+                            force=force,
+                        )
+                    except Exception as exc:
+                        dart_error = str(exc)
+                    if kis_future is not None:
+                        try:
+                            snapshot = kis_future.result()
+                        except Exception:  # broad catch to show UI errors
+                            set_status("KIS 실패, DART만 표시")
 
-                try:
-                    dart_data = fetch_dart_financials(
-                        user_input,
+                if dart_data:
+                    dart_data = apply_dart_market_inputs(
+                        dart_data,
                         fallback_listed_shares=snapshot.listed_shares,
-                        market_price=market_price,
+                        market_price=parse_amount(snapshot.price),
                     )
-                    if dart_data and dart_data.get("corp_name"):
-                        snapshot.name = dart_data.get("corp_name")
-                    if dart_data and dart_data.get("corp_code"):
-                        snapshot.code = dart_data.get("corp_code")
-                except Exception as exc:
-                    dart_error = str(exc)
+                    # The snapshot may be a shared cached value, so update a copy.
+                    corp_fields = {
+                        field: value
+                        for field, value in (("name", dart_data.get("corp_name")), ("code", dart_data.get("corp_code")))
+                        if value
+                    }
+                    if corp_fields:
+                        snapshot = replace(snapshot, **corp_fields)
 
                 update_view(snapshot, dart_data)
                 if dart_error:
@@ -5778,7 +6937,7 @@ def build_gui():
                 else:
                     set_status("Done")
 
-            threading.Thread(target=worker, daemon=True).start()
+            submit_fetch(worker)
             return
 
         if selected_country in GLOBAL_MARKETS:
@@ -5787,7 +6946,7 @@ def build_gui():
                 try:
                     snapshot, detail = fetch_global_financials(user_input, selected_country)
                 except Exception as exc:
-                    messagebox.showerror("Yahoo lookup failed", str(exc))
+                    call_on_ui(messagebox.showerror, "Yahoo lookup failed", str(exc))
                     update_view(PriceSnapshot(name="N/A", code=user_input or "-", price="N/A", per="N/A", pbr="N/A"), None)
                     set_status(f"Yahoo 실패: {exc}")
                     return
@@ -5795,7 +6954,7 @@ def build_gui():
                 update_view(snapshot, detail)
                 set_status("Done")
 
-            threading.Thread(target=worker, daemon=True).start()
+            submit_fetch(worker)
             return
 
         def worker():
@@ -5803,7 +6962,7 @@ def build_gui():
             try:
                 snapshot, detail = fetch_edgar_financials(user_input)
             except Exception as exc:
-                messagebox.showerror("EDGAR lookup failed", str(exc))
+                call_on_ui(messagebox.showerror, "EDGAR lookup failed", str(exc))
                 update_view(PriceSnapshot(name="N/A", code=user_input or "-", price="N/A", per="N/A", pbr="N/A"), None)
                 set_status(f"EDGAR 실패: {exc}")
                 return
@@ -5811,16 +6970,36 @@ def build_gui():
             update_view(snapshot, detail)
             set_status("Done")
 
-        threading.Thread(target=worker, daemon=True).start()
+        submit_fetch(worker)
 
-    ttk.Label(root, text="Company name or code").grid(row=0, column=0, sticky="w")
+    # Coalesce a burst of Lookup clicks / Enter presses into a single fetch.
+    pending_fetch: Dict[str, Optional[str]] = {"after_id": None}
+
+    def run_pending_fetch():
+        pending_fetch["after_id"] = None
+        do_fetch()
+
+    def schedule_fetch(event=None):
+        if pending_fetch["after_id"] is not None:
+            root.after_cancel(pending_fetch["after_id"])
+        pending_fetch["after_id"] = root.after(250, run_pending_fetch)
+
+    # Label and checkbox share column 0 through their own frame so they never draw over each other.
+    input_header = ttk.Frame(root)
+    input_header.grid(row=0, column=0, sticky="ew", padx=(0, 8))
+    input_header.columnconfigure(0, weight=1)
+    ttk.Label(input_header, text="Company name or code").grid(row=0, column=0, sticky="w")
+    ttk.Checkbutton(input_header, text="Force refresh", variable=force_refresh_var).grid(
+        row=0, column=1, sticky="e", padx=(8, 0)
+    )
     ttk.Label(root, text="Country").grid(row=0, column=1, sticky="e")
     country_combo = ttk.Combobox(root, textvariable=country_var, values=COUNTRY_CHOICES, state="readonly", width=8)
     country_combo.grid(row=0, column=2, sticky="ew")
     entry = ttk.Entry(root, textvariable=input_var)
     entry.grid(row=1, column=0, sticky="ew", padx=(0, 8))
     entry.focus()
-    ttk.Button(root, text="Lookup", command=do_fetch).grid(row=1, column=1, sticky="ew")
+    entry.bind("<Return>", schedule_fetch)
+    ttk.Button(root, text="Lookup", command=schedule_fetch).grid(row=1, column=1, sticky="ew")
     scan_button = ttk.Button(root, text="Range Scan", command=open_scan_modal)
     scan_button.grid(row=1, column=2, sticky="ew", padx=(8, 0))
 
@@ -5845,35 +7024,41 @@ def build_gui():
     info_frame.grid(row=2, column=0, columnspan=2, pady=(12, 8), sticky="ew")
     info_frame.grid_columnconfigure(1, weight=1)
 
-    def add_row(label_text: str, var: tk.StringVar, row_idx: int):
-        ttk.Label(info_frame, text=label_text, width=12).grid(row=row_idx, column=0, sticky="w", pady=2)
-        ttk.Label(info_frame, textvariable=var, width=32).grid(row=row_idx, column=1, sticky="w", pady=2)
-
-    add_row("Name", name_var, 0)
-    add_row("Price", price_var, 1)
-    add_row("PER", per_var, 2)
-    add_row("PBR", pbr_var, 3)
-    ttk.Label(info_frame, textvariable=debt_label_var, width=12).grid(row=4, column=0, sticky="w", pady=2)
-    ttk.Label(info_frame, textvariable=debt_var, width=32).grid(row=4, column=1, sticky="w", pady=2)
-    ttk.Label(info_frame, textvariable=ib_debt_label_var, width=12).grid(row=5, column=0, sticky="w", pady=2)
-    ttk.Label(info_frame, textvariable=ib_debt_var, width=32).grid(row=5, column=1, sticky="w", pady=2)
-    add_row("사업연도(DART)", dart_year_var, 6)
-    add_row("주당 순현금", dart_net_cash_ps_var, 7)
-    add_row("주당 순현금/주가", dart_net_cash_ps_ratio_var, 8)
-    add_row("매출액", dart_sales_var, 9)
-    add_row("영업이익", dart_op_var, 10)
-    add_row("매출성장률(5Y)", dart_sales_growth_var, 11)
-    add_row("영업이익성장률(5Y)", dart_op_growth_var, 12)
-    add_row("당기순이익성장률(5Y)", dart_net_income_growth_var, 13)
-    add_row("자본총계", dart_equity_var, 14)
+    # Row label/value widths live in two named styles instead of per-widget options.
+    style.configure("InfoKey.TLabel", width=12)
+    style.configure("InfoValue.TLabel", width=32)
+    info_rows = (
+        ("Name", name_var),
+        ("Price", price_var),
+        ("PER", per_var),
+        ("PBR", pbr_var),
+        (debt_label_var, debt_var),
+        (ib_debt_label_var, ib_debt_var),
+        ("사업연도(DART)", dart_year_var),
+        ("주당 순현금", dart_net_cash_ps_var),
+        ("주당 순현금/주가", dart_net_cash_ps_ratio_var),
+        ("매출액", dart_sales_var),
+        ("영업이익", dart_op_var),
+        ("매출성장률(5Y)", dart_sales_growth_var),
+        ("영업이익성장률(5Y)", dart_op_growth_var),
+        ("당기순이익성장률(5Y)", dart_net_income_growth_var),
+        ("자본총계", dart_equity_var),
+    )
+    for row_idx, (label, var) in enumerate(info_rows):
+        label_option = {"text": label} if isinstance(label, str) else {"textvariable": label}
+        ttk.Label(info_frame, style="InfoKey.TLabel", **label_option).grid(row=row_idx, column=0, sticky="w", pady=2)
+        ttk.Label(info_frame, textvariable=var, style="InfoValue.TLabel").grid(row=row_idx, column=1, sticky="w", pady=2)
 
     status_bar = ttk.Label(root, textvariable=status_var, anchor="w", relief="sunken")
     status_bar.grid(row=3, column=0, columnspan=2, sticky="ew", pady=(8, 0))
 
     root.mainloop()
+    submit_fetch(None)
 
 
 if __name__ == "__main__":
+    import argparse  # only the script entry point parses arguments; importing app stays lean
+
     parser = argparse.ArgumentParser(description="Korea Investment PER/PBR viewer")
     parser.add_argument("--cli", action="store_true", help="Run in CLI mode")
     parser.add_argument("--dart", action="store_true", help="Run DART financial summary lookup (CLI)")
@@ -59,6 +59,9 @@ try:
 except Exception:  # pragma: no cover
     requests = None  # type: ignore
 
+# One keep-alive session for the filing downloads and Yahoo fallbacks (same hosts, many companies).
+_HTTP_SESSION = requests.Session() if requests is not None else None
+
 
 DEFAULT_OUTPUT = Path("data") / "uk_fundamentals_cache.jsonl"
 DEFAULT_DOWNLOAD_DIR = Path("data") / "uk_filings"
@@ -573,7 +576,7 @@ def request_get(url: str, timeout: int):
         "User-Agent": "mr-leon-uk-cache-builder/1.0 (+local research tool)",
         "Accept": "text/html,application/xhtml+xml,application/xml,application/zip,*/*",
     }
-    resp = requests.get(url, headers=headers, timeout=timeout, allow_redirects=True)
+    resp = _HTTP_SESSION.get(url, headers=headers, timeout=timeout, allow_redirects=True)
     resp.raise_for_status()
     return resp
 
@@ -1207,7 +1210,7 @@ def yahoo_series_by_year(series: Dict[str, List[Dict[str, Any]]], types: Sequenc
 def fetch_yahoo_chart_meta(symbol: str, timeout: int) -> Dict[str, Any]:
     if requests is None:
         raise RuntimeError("requests is required for Yahoo fallback")
-    resp = requests.get(
+    resp = _HTTP_SESSION.get(
         YAHOO_CHART_URL.format(symbol=urllib.parse.quote(symbol, safe="")),
         headers=YAHOO_HEADERS,
         timeout=timeout,
@@ -1230,7 +1233,7 @@ def fetch_yahoo_search_symbols(query: str, timeout: int) -> List[str]:
     text = str(query or "").strip()
     if not text:
         return []
-    resp = requests.get(
+    resp = _HTTP_SESSION.get(
         YAHOO_SEARCH_URL,
         headers=YAHOO_HEADERS,
         params={"q": text, "quotesCount": 8, "newsCount": 0},
@@ -1295,7 +1298,7 @@ def yahoo_search_candidate_symbols(base_record: Dict[str, Any], timeout: int) ->
 def fetch_yahoo_timeseries(symbol: str, timeout: int) -> Dict[str, List[Dict[str, Any]]]:
     if requests is None:
         raise RuntimeError("requests is required for Yahoo fallback")
-    resp = requests.get(
+    resp = _HTTP_SESSION.get(
         YAHOO_TIMESERIES_URL.format(symbol=urllib.parse.quote(symbol, safe="")),
         headers=YAHOO_HEADERS,
         params={
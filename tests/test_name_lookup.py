@@ -0,0 +1,391 @@
+import io
+import json
+import os
+import tempfile
+import unittest
+import zipfile
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch
+
+import app
+
+
+KRX_LISTING_HTML = """
+<html><head><meta http-equiv="Content-Type" content="text/html; charset=euc-kr"></head>
+<body><table>
+<tr><th>회사명</th><th>시장구분</th><th>종목코드</th></tr>
+<tr><td>삼성전자</td><td>유가</td><td style="mso-number-format:'\\@';">005930</td></tr>
+<tr><td>SK하이닉스</td><td>유가</td><td style="mso-number-format:'\\@';">000660</td></tr>
+<tr><td>AT&amp;T 코리아</td><td>코스닥</td><td>12345</td></tr>
+<tr><td>헤더없음</td><td>코스닥</td><td>N/A</td></tr>
+</table></body></html>
+"""
+
+DART_CORP_XML = """<?xml version="1.0" encoding="UTF-8"?>
+<result>
+<list><corp_code>00126380</corp_code><corp_name>삼성전자</corp_name><stock_code>005930</stock_code></list>
+<list><corp_code>00164779</corp_code><corp_name>SK 하이닉스</corp_name><stock_code>000660</stock_code></list>
+<list><corp_code>00999999</corp_code><corp_name>비상장회사</corp_name><stock_code> </stock_code></list>
+</result>
+"""
+
+
+def dart_corp_zip(xml_text: str) -> bytes:
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w") as zf:
+        zf.writestr("CORPCODE.xml", xml_text.encode("utf-8"))
+    return buffer.getvalue()
+
+
+class FakeResponse:
+    def __init__(self, content: bytes, status_code: int = 200, headers=None):
+        self.content = content
+        self.status_code = status_code
+        self.headers = headers or {}
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *_exc):
+        return False
+
+    def json(self):
+        return json.loads(self.content)
+
+    def iter_content(self, chunk_size=1):
+        for start in range(0, len(self.content), chunk_size):
+            yield self.content[start : start + chunk_size]
+
+
+class NameLookupTests(unittest.TestCase):
+    def setUp(self):
+        app.clear_lookup_maps()
+        self._cache_dir = tempfile.TemporaryDirectory()
+        self._cache_patch = patch.dict(os.environ, {"LOOKUP_CACHE_DIR": self._cache_dir.name})
+        self._cache_patch.start()
+
+    def tearDown(self):
+        self._cache_patch.stop()
+        self._cache_dir.cleanup()
+        app.clear_lookup_maps()
+
+    def test_krx_listing_rows_are_unescaped_and_stripped(self):
+        rows = list(app._iter_krx_listing_rows(KRX_LISTING_HTML.encode("euc-kr")))
+        self.assertIn(("삼성전자", "005930"), rows)
+        self.assertIn(("AT&T 코리아", "12345"), rows)
+        self.assertEqual(len(rows), 4)
+
+    def test_krx_listing_rows_without_lxml(self):
+        with patch.object(app, "lxml_etree", None):
+            rows = list(app._iter_krx_listing_rows(KRX_LISTING_HTML.encode("euc-kr")))
+        self.assertEqual(rows, list(app._iter_krx_listing_rows(KRX_LISTING_HTML.encode("euc-kr"))))
+        self.assertEqual(rows[0], ("삼성전자", "005930"))
+
+    def test_load_name_map_builds_normalized_name_to_code(self):
+        response = FakeResponse(KRX_LISTING_HTML.encode("euc-kr"))
+        with patch.object(app._HTTP_SESSION, "get", return_value=response):
+            mapping = app.load_name_map()
+
+        self.assertEqual(mapping["삼성전자"], "005930")
+        self.assertEqual(mapping["sk하이닉스"], "000660")
+        self.assertEqual(mapping["at&t코리아"], "012345")
+        self.assertNotIn("헤더없음", mapping)
+
+    def test_concurrent_first_loads_build_the_name_map_once(self):
+        calls = []
+
+        def slow_build():
+            calls.append(1)
+            app.time.sleep(0.05)
+            return {"삼성전자": "005930"}
+
+        with patch.object(app, "_build_name_map", side_effect=slow_build):
+            with ThreadPoolExecutor(max_workers=4) as executor:
+                results = list(executor.map(lambda _: app.load_name_map(), range(4)))
+
+        self.assertEqual(len(calls), 1)
+        self.assertTrue(all(result is results[0] for result in results))
+
+    def test_load_dart_corp_map_streams_corp_list(self):
+        response = FakeResponse(dart_corp_zip(DART_CORP_XML))
+        with patch.dict(os.environ, {"DART_KEY": "test"}), patch.object(app._HTTP_SESSION, "get", return_value=response):
+            name_map, stock_map, code_to_name = app.load_dart_corp_map()
+
+        self.assertEqual(name_map["sk하이닉스"], "00164779")
+        self.assertEqual(stock_map["005930"], "00126380")
+        self.assertEqual(code_to_name["00999999"], "비상장회사")
+        self.assertEqual(len(stock_map), 2)
+
+    def test_load_dart_corp_map_without_lxml(self):
+        response = FakeResponse(dart_corp_zip(DART_CORP_XML))
+        with patch.dict(os.environ, {"DART_KEY": "test"}), patch.object(
+            app._HTTP_SESSION, "get", return_value=response
+        ), patch.object(app, "lxml_etree", None):
+            name_map, stock_map, _ = app.load_dart_corp_map()
+
+        self.assertEqual(name_map["삼성전자"], "00126380")
+        self.assertEqual(stock_map["000660"], "00164779")
+
+    def test_load_dart_corp_map_reports_broken_xml(self):
+        response = FakeResponse(dart_corp_zip("<result><list><corp_code>1</list>"))
+        with patch.dict(os.environ, {"DART_KEY": "test"}), patch.object(app._HTTP_SESSION, "get", return_value=response):
+            with self.assertRaises(app.DartError):
+                app.load_dart_corp_map()
+
+    def test_describe_dart_error_payload_reads_json_with_and_without_orjson(self):
+        payload = '{"status": "013", "message": "조회된 데이타가 없습니다."}'.encode("utf-8")
+        for json_module in (app.orjson, None):
+            with self.subTest(orjson=json_module is not None), patch.object(app, "orjson", json_module):
+                self.assertEqual(app.describe_dart_error_payload(payload), "013 조회된 데이타가 없습니다.")
+
+    def test_json_responses_accept_nan_with_and_without_orjson(self):
+        body = FakeResponse(b'{"quoteResponse": {"result": [{"trailingPE": NaN}]}}')
+        for json_module in (app.orjson, None):
+            with self.subTest(orjson=json_module is not None), patch.object(app, "orjson", json_module):
+                pe = app._json(body)["quoteResponse"]["result"][0]["trailingPE"]
+                self.assertNotEqual(pe, pe)
+
+    def test_load_name_map_reuses_fresh_disk_cache(self):
+        response = FakeResponse(KRX_LISTING_HTML.encode("euc-kr"))
+        with patch.object(app._HTTP_SESSION, "get", return_value=response) as mocked:
+            first = app.load_name_map()
+            app.clear_lookup_maps()
+            second = app.load_name_map()
+
+        self.assertEqual(first, second)
+        self.assertEqual(mocked.call_count, 1)
+
+    def test_edgar_ticker_map_is_cached_on_disk_and_revalidated(self):
+        payload = json.dumps({"0": {"ticker": "aapl", "cik_str": 320193, "title": "Apple Inc."}}).encode("utf-8")
+        listing = FakeResponse(payload, headers={"ETag": '"sec1"'})
+        with patch.object(app._HTTP_SESSION, "get", return_value=listing) as mocked:
+            first = app.load_edgar_ticker_map()
+            app.clear_lookup_maps()
+            self.assertEqual(app.load_edgar_ticker_map(), first)
+        self.assertEqual(mocked.call_count, 1)
+        self.assertEqual(first[0]["AAPL"]["cik"], "0000320193")
+
+        app.clear_lookup_maps()
+        os.utime(app.lookup_cache_dir() / app.EDGAR_TICKER_MAP_CACHE_FILE, (0, 0))
+        with patch.object(app._HTTP_SESSION, "get", return_value=FakeResponse(b"", status_code=304)) as mocked:
+            self.assertEqual(app.load_edgar_ticker_map(), first)
+        self.assertEqual(mocked.call_args.kwargs["headers"]["If-None-Match"], '"sec1"')
+        self.assertIn("User-Agent", mocked.call_args.kwargs["headers"])
+
+    def test_load_dart_corp_map_describes_error_payload(self):
+        payload = b'<?xml version="1.0" encoding="UTF-8"?><result><status>020</status><message>limit</message></result>'
+        with patch.dict(os.environ, {"DART_KEY": "test"}), patch.object(
+            app._HTTP_SESSION, "get", return_value=FakeResponse(payload)
+        ):
+            with self.assertRaisesRegex(app.DartError, "020 limit"):
+                app.load_dart_corp_map()
+
+    def test_dart_report_lists_are_cached_on_disk(self):
+        ok = FakeResponse('{"status": "000", "list": [{"account_nm": "매출액", "thstrm_amount": "1"}]}'.encode("utf-8"))
+        with patch.dict(os.environ, {"DART_KEY": "test"}), patch.object(
+            app._HTTP_SESSION, "get", return_value=ok
+        ) as mocked:
+            first = app.fetch_dart_single_accounts("00126380", "2024", "11011")
+            second = app.fetch_dart_single_accounts("00126380", "2024", "11011")
+
+        self.assertEqual(first, second)
+        self.assertEqual(mocked.call_count, 1)
+        self.assertEqual(
+            [path.name for path in (app.lookup_cache_dir() / "dart_reports").iterdir()],
+            ["single_00126380_2024_11011.pkl"],
+        )
+
+    def test_dart_report_errors_are_not_cached(self):
+        missing = FakeResponse('{"status": "013", "message": "no data"}'.encode("utf-8"))
+        with patch.dict(os.environ, {"DART_KEY": "test"}), patch.object(
+            app._HTTP_SESSION, "get", return_value=missing
+        ) as mocked:
+            base_params = {"crtfc_key": "test", "corp_code": "00126380"}
+            self.assertEqual(app._fetch_dart_period_entries(base_params, "2025", "11014"), ([], "013 no data"))
+            app._fetch_dart_period_entries(base_params, "2025", "11014")
+
+        self.assertEqual(mocked.call_count, 2)
+
+    def test_cached_lookup_reuses_fresh_results_unless_forced(self):
+        app._LOOKUP_RESULTS.clear()
+        calls = []
+
+        def fetch():
+            calls.append(1)
+            return len(calls)
+
+        self.assertEqual(app.cached_lookup(("test", "005930"), 60, fetch), 1)
+        self.assertEqual(app.cached_lookup(("test", "005930"), 60, fetch), 1)
+        self.assertEqual(app.cached_lookup(("test", "005930"), 60, fetch, force=True), 2)
+        self.assertEqual(app.cached_lookup(("test", "005930"), 0, fetch), 3)
+        self.assertEqual(app.cached_lookup(("test", "000660"), 60, fetch), 4)
+        app._LOOKUP_RESULTS.clear()
+
+    def test_usdkrw_rate_is_cached_and_falls_back_to_stale_rate(self):
+        env = {key: value for key, value in os.environ.items() if key != "USD_KRW_RATE"}
+        with patch.dict(os.environ, env, clear=True), patch.object(app, "_USDKRW_RATE", None), patch.object(
+            app, "_fetch_usdkrw_rate_live", side_effect=[1300.0, None]
+        ) as live:
+            self.assertEqual(app.fetch_usdkrw_rate(), 1300.0)
+            self.assertEqual(app.fetch_usdkrw_rate(), 1300.0)
+            self.assertEqual(live.call_count, 1)
+            later = app.time.monotonic() + app.USDKRW_CACHE_SECONDS + 1
+            with patch.object(app.time, "monotonic", return_value=later):
+                self.assertEqual(app.fetch_usdkrw_rate(), 1300.0)
+            self.assertEqual(live.call_count, 2)
+
+    def test_kis_token_is_reused_from_disk_by_a_new_process(self):
+        token = FakeResponse(json.dumps({"access_token": "tok", "expires_in": 86400}).encode("utf-8"))
+        with patch.dict(app.KisClient._shared_tokens, clear=True), patch.object(
+            app._HTTP_SESSION, "post", return_value=token
+        ) as post:
+            first = app.KisClient("key", "secret")
+            self.assertEqual(first._ensure_token(), "tok")
+            app.KisClient._shared_tokens.clear()
+            self.assertEqual(app.KisClient("key", "secret")._ensure_token(), "tok")
+            self.assertEqual(app.KisClient("other", "secret")._ensure_token(), "tok")
+
+        self.assertEqual(post.call_count, 2)
+        if os.name == "posix":
+            self.assertEqual(first._disk_token_path().stat().st_mode & 0o777, 0o600)
+
+    def test_kis_request_reissues_a_token_the_server_rejects(self):
+        stale = app.KisClient("key", "secret")
+        stale._token, stale._token_expiry = "old", app.time.time() + 3600
+        stale._write_disk_token()
+        fresh = FakeResponse(json.dumps({"access_token": "new", "expires_in": 86400}).encode("utf-8"))
+        price = FakeResponse(json.dumps({"output": {"hts_kor_isnm": "삼성전자", "stck_prpr": "70000"}}).encode("utf-8"))
+        with patch.dict(app.KisClient._shared_tokens, clear=True), patch.object(
+            app._HTTP_SESSION, "post", return_value=fresh
+        ) as post, patch.object(app._HTTP_SESSION, "get", side_effect=[FakeResponse(b"", status_code=401), price]) as get:
+            snapshot = app.KisClient("key", "secret").get_price_snapshot("005930")
+
+        self.assertEqual(snapshot.name, "삼성전자")
+        self.assertEqual(post.call_count, 1)
+        self.assertEqual(
+            [call.kwargs["headers"]["authorization"] for call in get.call_args_list], ["Bearer old", "Bearer new"]
+        )
+        self.assertEqual(stale._read_disk_token()[0], "new")
+
+    def test_shared_session_leaves_rate_limits_and_token_errors_to_callers(self):
+        retry = app._HTTP_SESSION.get_adapter("https://openapi.koreainvestment.com").max_retries
+        self.assertTrue(retry.is_retry("GET", 503))
+        self.assertFalse(retry.is_retry("GET", 500))
+        self.assertFalse(retry.is_retry("GET", 429, has_retry_after=True))
+
+    def test_numeric_env_settings_fall_back_on_typos(self):
+        with patch.dict(os.environ, {"SCAN_WORKERS": "8x", "USDKRW_TTL": " 60 ", "KIS_REQUESTS_PER_SECOND": "nan"}):
+            self.assertEqual(app._env_int("SCAN_WORKERS", 8, minimum=1), 8)
+            self.assertEqual(app._env_int("USDKRW_TTL", 300), 60)
+            self.assertEqual(app._env_float("KIS_REQUESTS_PER_SECOND", 15), 15)
+            self.assertEqual(app._env_int("UNSET_SETTING_FOR_TEST", 7), 7)
+        with patch.dict(os.environ, {"SCAN_WORKERS": "0"}):
+            self.assertEqual(app._env_int("SCAN_WORKERS", 8, minimum=1), 1)
+
+    def test_rate_limiter_spaces_request_starts(self):
+        limiter = app._RateLimiter(4)
+        with patch.object(app.time, "monotonic", return_value=100.0), patch.object(app.time, "sleep") as sleep:
+            for _ in range(3):
+                limiter.wait()
+        self.assertEqual([call.args[0] for call in sleep.call_args_list], [0.25, 0.5])
+
+        with patch.object(app.time, "sleep") as sleep:
+            app._RateLimiter(0).wait()
+        sleep.assert_not_called()
+
+    def test_expired_name_map_is_revalidated_with_etag(self):
+        listing = FakeResponse(KRX_LISTING_HTML.encode("euc-kr"), headers={"ETag": '"v1"'})
+        with patch.object(app._HTTP_SESSION, "get", return_value=listing):
+            first = app.load_name_map()
+        app.clear_lookup_maps()
+
+        cache_path = app.lookup_cache_dir() / app.KRX_NAME_MAP_CACHE_FILE
+        os.utime(cache_path, (0, 0))
+        not_modified = FakeResponse(b"", status_code=304)
+        with patch.object(app._HTTP_SESSION, "get", return_value=not_modified) as mocked:
+            second = app.load_name_map()
+
+        self.assertEqual(first, second)
+        self.assertEqual(mocked.call_args.kwargs["headers"], {"If-None-Match": '"v1"'})
+        self.assertGreater(cache_path.stat().st_mtime, 0)
+
+    def test_normalize_name_drops_every_whitespace_kind(self):
+        for text in ("SK 하이닉스", "SK\u00a0하이닉스", "SK\u3000하이닉스", " sk\t하이닉스\n", "SK하이닉스"):
+            with self.subTest(text=text):
+                self.assertEqual(app.normalize_name(text), "sk하이닉스")
+                self.assertEqual(app.normalize_name(text), "".join(text.casefold().split()))
+        self.assertEqual(app.normalize_name(None), "")
+        self.assertEqual(app.normalize_name("AT&T"), "at&t")
+
+    def test_partial_match_index_matches_linear_scan_order(self):
+        mapping = {"삼성전자": "005930", "삼성전자우": "005935", "sk하이닉스": "000660", "lg": "003550"}
+        index = app._SubstringIndex(mapping)
+
+        self.assertEqual(index.first_match("삼성"), "삼성전자")
+        self.assertEqual(index.first_match("하이닉스"), "sk하이닉스")
+        self.assertEqual(index.first_match("lg전자"), "lg")
+        self.assertIsNone(index.first_match("현대차"))
+
+    def test_close_match_tolerates_typos_only_above_cutoff(self):
+        index = app._SubstringIndex({"삼성바이오로직스": "207940", "sk하이닉스": "000660"})
+        self.assertEqual(index.close_match("삼성바이오로직"), "삼성바이오로직스")
+        self.assertEqual(index.close_match("sk하이닉수"), "sk하이닉스")
+        self.assertIsNone(index.close_match("카카오뱅크"))
+
+    def test_lookup_code_by_name_uses_partial_fallback(self):
+        mapping = {"삼성전자": "005930", "sk하이닉스": "000660"}
+        with patch.object(app, "load_name_map", return_value=mapping):
+            self.assertEqual(app.lookup_code_by_name("하이닉스"), "000660")
+            self.assertEqual(app.lookup_code_by_name("삼성 전자"), "005930")
+            self.assertIsNone(app.lookup_code_by_name("카카오"))
+
+    def test_typo_is_suggested_instead_of_resolved(self):
+        with patch.object(app, "load_name_map", return_value={"sk하이닉스": "000660"}):
+            with self.assertRaisesRegex(app.KisError, "Did you mean 'sk하이닉스'"):
+                app.lookup_code_by_name("SK하이닉수")
+
+        dart_maps = ({"sk하이닉스": "00164779"}, {}, {"00164779": "에스케이하이닉스"})
+        with patch.object(app, "load_dart_corp_map", return_value=dart_maps):
+            with self.assertRaisesRegex(app.DartError, "에스케이하이닉스"):
+                app.resolve_dart_corp("SK하이닉수")
+            self.assertEqual(app.resolve_dart_corp("하이닉스"), ("00164779", "에스케이하이닉스"))
+
+    def test_resolved_names_survive_a_restart_without_loading_maps(self):
+        mapping = {"삼성전자": "005930", "sk하이닉스": "000660"}
+        with patch.object(app, "load_name_map", return_value=mapping):
+            self.assertEqual(app.lookup_code_by_name("SK 하이닉스"), "000660")
+        app._flush_resolved_names()
+        app.clear_lookup_maps()
+
+        with patch.object(app, "load_name_map", side_effect=AssertionError("map loaded")):
+            self.assertEqual(app.lookup_code_by_name("SK하이닉스"), "000660")
+
+        app.clear_lookup_maps()
+        with patch.object(app.time, "time", return_value=app.time.time() + app.RESOLVED_NAMES_MAX_AGE_SECONDS + 1):
+            with patch.object(app, "load_name_map", return_value={"sk하이닉스": "000661"}):
+                self.assertEqual(app.lookup_code_by_name("SK하이닉스"), "000661")
+
+    def test_only_exact_resolutions_are_remembered_and_written_in_one_batch(self):
+        mapping = {"삼성전자": "005930", "sk하이닉스": "000660"}
+        with patch.object(app, "load_name_map", return_value=mapping), patch.object(
+            app, "_write_lookup_cache"
+        ) as write:
+            self.assertEqual(app.lookup_code_by_name("하이닉스"), "000660")
+            self.assertEqual(app.lookup_code_by_name("삼성전자"), "005930")
+            self.assertEqual(app.lookup_code_by_name("SK하이닉스"), "000660")
+            write.assert_not_called()
+            app._flush_resolved_names()
+            app._flush_resolved_names()
+
+        write.assert_called_once()
+        self.assertEqual(sorted(write.call_args.args[1]), ["krx:sk하이닉스", "krx:삼성전자"])
+
+    def test_concurrent_lookup_cache_writes_use_separate_temp_files(self):
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            list(executor.map(lambda n: app._write_lookup_cache("race.pkl", {"n": n, "pad": "x" * 100_000}), range(16)))
+        self.assertIn(app._read_lookup_cache("race.pkl")["n"], range(16))
+        self.assertEqual(sorted(path.name for path in app.lookup_cache_dir().iterdir()), ["race.pkl"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,6 +1,21 @@
+import datetime
 import unittest
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch
 
-from app import compute_net_cash, format_per_share, parse_stock_totals
+import app
+from app import (
+    apply_dart_market_inputs,
+    build_report_periods,
+    compute_net_cash,
+    extract_accounts,
+    find_account_amount,
+    format_amount,
+    format_per_share,
+    normalized_account_rows,
+    parse_stock_totals,
+    summarize_accounts,
+)
 
 
 class NetCashPerShareTests(unittest.TestCase):
@@ -37,6 +52,151 @@ class NetCashPerShareTests(unittest.TestCase):
         self.assertEqual(debt_value, 0)
         self.assertEqual(format_per_share(net_cash, 3), "50.00")
 
+    def test_summarize_accounts_keeps_first_valued_row(self):
+        entries = [
+            {"account_nm": "매출액", "thstrm_amount": "-"},
+            {"account_nm": " 매출 액 ", "thstrm_amount": "1,000"},
+            {"account_nm": "영업수익", "thstrm_amount": "2,000"},
+            {"account_nm": "부채 총계", "thstrm_add_amount": "(300)"},
+            {"account_nm": None, "thstrm_amount": "9"},
+        ]
+        summary = summarize_accounts(entries)
+        self.assertEqual(summary["매출액"], "1,000")
+        self.assertEqual(summary["부채총계"], "-300")
+        self.assertEqual(summary["자본총계"], "N/A")
+        self.assertEqual(summarize_accounts(None)["매출액"], "N/A")
+
+    def test_extract_accounts_matches_find_account_amount(self):
+        entries = [
+            {"account_nm": "현금및현금성자산", "thstrm_amount": "N/A"},
+            {"account_nm": "현금 및 현금성자산", "thstrm_amount": "1,500"},
+            {"account_nm": "단기차입금", "thstrm_amount": "(200)"},
+            {"account_nm": "회사채", "thstrm_add_amount": "300"},
+            {"account_nm": "사채", "thstrm_amount": "999"},
+        ]
+        targets = ("현금및현금성자산", "단기차입금", "사채", "장기차입금")
+        amounts = extract_accounts(entries, targets)
+        self.assertEqual(amounts, {"현금및현금성자산": 1500, "단기차입금": -200, "사채": 300})
+        for target in targets:
+            self.assertEqual(amounts.get(target), find_account_amount(entries, target))
+
+    def test_summarize_accounts_stops_reading_once_every_label_is_filled(self):
+        filled = [{"account_nm": label, "thstrm_amount": "1"} for label in app.ACCOUNT_SYNONYMS]
+
+        def rows():
+            yield from filled
+            raise AssertionError("read past the last needed row")
+
+        self.assertNotIn("N/A", summarize_accounts(rows()).values())
+
+    def test_prenormalized_rows_give_same_summary_and_amounts(self):
+        entries = [
+            {"account_nm": " 매출 액 ", "thstrm_amount": "1,000"},
+            {"account_nm": "", "thstrm_amount": "5"},
+            {"account_nm": "단기차입금", "thstrm_amount": "(200)"},
+        ]
+        rows = normalized_account_rows(entries)
+        self.assertEqual([norm for norm, _ in rows], ["매출액", "단기차입금"])
+        self.assertEqual(summarize_accounts(entries, rows), summarize_accounts(entries))
+        targets = ("매출액", "단기차입금")
+        self.assertEqual(extract_accounts(entries, targets, rows), extract_accounts(entries, targets))
+
+    def test_build_report_periods_orders_by_release_and_skips_unreleased(self):
+        periods = build_report_periods(today=datetime.date(2025, 5, 1), years_back=1)
+        self.assertEqual(
+            periods,
+            (("2025", "11013"), ("2024", "11011"), ("2024", "11014"), ("2024", "11012"), ("2024", "11013")),
+        )
+        self.assertEqual(build_report_periods(today=datetime.date(2025, 4, 30), years_back=0)[0], ("2024", "11011"))
+        self.assertEqual(
+            build_report_periods("2023"),
+            (("2023", "11011"), ("2023", "11014"), ("2023", "11012"), ("2023", "11013")),
+        )
+
+    def test_format_amount_keeps_canonical_strings_and_reformats_others(self):
+        self.assertEqual(format_amount("1,234,567"), "1,234,567")
+        self.assertEqual(format_amount("1234567"), "1,234,567")
+        self.assertEqual(format_amount("-0"), "0")
+        self.assertEqual(format_amount("0,123"), "123")
+        self.assertEqual(format_amount("(1,000)"), "-1,000")
+        self.assertEqual(format_amount("-"), "N/A")
+
+    def test_numeric_parsers_fast_paths_match_string_parsing(self):
+        self.assertEqual(app.parse_float(12), 12.0)
+        self.assertEqual(app.parse_float("(1,234.5)"), -1234.5)
+        self.assertEqual(app.parse_float("12.5%"), 12.5)
+        self.assertIsNone(app.parse_float("N/A"))
+        self.assertIsNone(app.parse_float(True))
+        hits = app._parse_float_text.cache_info().hits
+        self.assertEqual(app.parse_float("(1,234.5)"), -1234.5)
+        self.assertEqual(app._parse_float_text.cache_info().hits, hits + 1)
+        self.assertEqual(app._parse_int("9,007,199,254,740,993"), 9_007_199_254_740_993)
+        self.assertEqual(app._parse_int("12.9"), 12)
+        self.assertEqual(app._parse_int(7), 7)
+        self.assertIsNone(app._parse_int("²"))
+        self.assertIsNone(app._parse_int(None))
+
+    def test_clean_number_formats_numbers_and_passes_text_through(self):
+        self.assertEqual(app.clean_number("1234"), "1,234.0")
+        self.assertEqual(app.clean_number(5), "5.0")
+        self.assertEqual(app.clean_number("-12.5"), "-12.5")
+        self.assertEqual(app.clean_number("해당없음"), "해당없음")
+        self.assertEqual(app.clean_number("NaN"), "nan")
+        self.assertEqual(app.clean_number("N/A"), "N/A")
+        self.assertEqual(app.clean_number("1,234"), "1,234")
+        self.assertEqual(app.clean_number(None), "None")
+
+    def test_apply_dart_market_inputs_prefers_dart_shares_and_falls_back_to_kis(self):
+        base = {"net_cash": 1_000_000, "dart_float_shares": 1_000}
+        merged = apply_dart_market_inputs(base, fallback_listed_shares=500, market_price=2_000)
+        self.assertEqual(merged["net_cash_per_share"], "1,000.00")
+        self.assertEqual(merged["net_cash_per_share_ratio"], "50.00%")
+        self.assertNotIn("float_shares", base)
+
+        fallback = apply_dart_market_inputs({"net_cash": 1_000_000, "dart_float_shares": None}, 500, None)
+        self.assertEqual(fallback["net_cash_per_share"], "2,000.00 (KIS 상장주식수)")
+        self.assertEqual(fallback["float_shares_display"], "500")
+        self.assertEqual(fallback["net_cash_per_share_ratio"], "N/A")
+
+    def test_collect_dart_annual_series_same_with_executor(self):
+        def fake_annual_values(corp_code, bsns_year):
+            if int(bsns_year) % 2 == 0:
+                raise app.DartError("missing")
+            return int(bsns_year), int(bsns_year) + 1, None
+
+        with patch.object(app, "_fetch_dart_annual_values", side_effect=fake_annual_values):
+            serial = app.collect_dart_annual_series("00126380", window_years=3)
+            with ThreadPoolExecutor(max_workers=4) as executor:
+                parallel = app.collect_dart_annual_series("00126380", window_years=3, executor=executor)
+
+        self.assertEqual(serial, parallel)
+        self.assertEqual(len(serial[0]), 4)
+        self.assertTrue(any(value is None for value in serial[0].values()))
+
+    def test_fetch_dart_financials_stops_probing_after_first_available_report(self):
+        periods = list(build_report_periods(years_back=4))
+
+        def fetch_period(base_params, year, report_code):
+            calls.append((year, report_code))
+            if periods.index((year, report_code)) < available_at - 1:
+                return [], "013"
+            return [{"account_nm": "매출액", "thstrm_amount": "1,000"}], None
+
+        for available_at in (1, 3):
+            calls = []
+            with patch.object(app, "resolve_dart_corp", return_value=("00126380", "삼성전자")), patch.object(
+                app, "get_dart_key", return_value="key"
+            ), patch.object(app, "_fetch_dart_annual_values", side_effect=app.DartError("missing")), patch.object(
+                app, "_fetch_dart_period_entries", side_effect=fetch_period
+            ), patch.object(app, "fetch_dart_single_accounts", return_value=[]), patch.object(
+                app, "fetch_dart_stock_totals", return_value=None
+            ):
+                data = app.fetch_dart_financials("삼성전자")
+
+            self.assertEqual(data["summary"]["매출액"], "1,000")
+            self.assertEqual((data["bsns_year"], data["reprt_code"]), periods[available_at - 1])
+            self.assertLessEqual(len(calls), available_at + app._DART_PERIOD_BATCH - 1)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -1,6 +1,8 @@
 import json
 import tempfile
+import threading
 import unittest
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from unittest.mock import patch
 
@@ -63,6 +65,59 @@ class RangeScanCacheTests(unittest.TestCase):
         self.assertEqual(record["net_income"], 100)
         self.assertIsNotNone(record["sales_growth_5y_avg_pct"])
 
+    def test_latest_fact_prefers_form_priority_then_latest_end_then_first_seen(self):
+        quarterly = dict(sec_fact(1, year=2025), form="10-Q")
+        future = sec_fact(2, year=2999)
+        facts = {
+            "facts": {
+                "us-gaap": {
+                    "Cash": {"units": {"USD": [quarterly, sec_fact(10, year=2023), sec_fact(20, year=2024), future]}},
+                    "CashAlt": {"units": {"USD": [sec_fact(30, year=2024), sec_fact("N/A", year=2024)]}},
+                }
+            }
+        }
+
+        self.assertEqual(app._extract_latest_fact(facts, "Cash"), 20.0)
+        self.assertEqual(app._extract_latest_fact_multi(facts, ("Cash", "CashAlt")), 20.0)
+        self.assertEqual(app._extract_latest_fact_multi(facts, ("CashAlt", "Cash")), 30.0)
+        self.assertEqual(app._extract_latest_fact(facts, "Cash", forms_priority=("10-Q", "10-K")), 1.0)
+        self.assertIsNone(app._extract_latest_fact(facts, "Missing"))
+        self.assertEqual(app._parse_iso_date("2024-12-31"), 739251)
+        self.assertEqual(app._parse_iso_date("2024-02-30"), 0)
+        self.assertEqual(app._parse_iso_date(""), 0)
+
+    def test_edgar_side_fetches_are_dropped_when_companyfacts_fail(self):
+        release = threading.Event()
+        executor = ThreadPoolExecutor(max_workers=1)
+        blocker = executor.submit(release.wait)
+        company = {"ticker": "AAPL", "cik": "0000320193", "name": "Apple Inc."}
+        try:
+            with patch.object(app, "_EDGAR_SIDE_EXECUTOR", executor), patch.object(
+                app, "resolve_edgar_company", return_value=company
+            ), patch.object(app, "load_company_facts", side_effect=app.EdgarError("no facts")), patch.object(
+                app, "fetch_yahoo_quote"
+            ) as quote, patch.object(app, "fetch_usdkrw_rate") as usdkrw:
+                with self.assertRaises(app.EdgarError):
+                    app.fetch_edgar_financials("AAPL")
+                release.set()
+                blocker.result()
+                executor.shutdown(wait=True)
+        finally:
+            release.set()
+            executor.shutdown(wait=True)
+        quote.assert_not_called()
+        usdkrw.assert_not_called()
+
+    def test_fundamentals_cache_lines_parse_with_and_without_orjson(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / "cache.jsonl"
+            path.write_text('{"code": "A", "per": NaN}\n{"code": "B", "per": 1.5}\nnot json\n{"per": 2}\n', encoding="utf-8")
+            for json_module in (app.orjson, None):
+                with self.subTest(orjson=json_module is not None), patch.object(app, "orjson", json_module):
+                    records = app.load_fundamentals_cache(path)
+                    self.assertEqual([record["code"] for record in records], ["A", "B"])
+                    self.assertEqual(app.load_cached_codes(path), {"A", "B"})
+
     def test_kr_cache_builder_writes_dart_detail_record(self):
         detail = {
             "corp_name": "Mock Corp",
@@ -558,7 +613,7 @@ class RangeScanCacheTests(unittest.TestCase):
                 return Response(chart_payload)
             return Response(timeseries_payload)
 
-        with patch.object(build_uk_cache_db.requests, "get", side_effect=fake_get):
+        with patch.object(build_uk_cache_db._HTTP_SESSION, "get", side_effect=fake_get):
             record = build_uk_cache_db.build_yahoo_timeseries_cache_record(
                 placeholder,
                 timeout=5,